@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
@@ -7,6 +8,59 @@ import pandas as pd
 
 ValidatorFn = Callable[[Any], bool]
 PathSpec = Tuple[str, ...]
+GetterFn = Callable[[Any], Any]
+
+# Returned by compiled getters when a path does not resolve (a present key
+# holding None is a resolved value and stops the candidate search).
+_MISSING = object()
+
+
+def _is_mapping(value: Any) -> bool:
+    return type(value) is dict or isinstance(value, Mapping)
+
+
+def _compile_path(path: PathSpec) -> GetterFn:
+    """
+    Turn a candidate path into a getter with the descent unrolled.
+
+    One- and two-segment paths (all current specs) get dedicated closures;
+    deeper paths fall back to a loop over the parent segments.
+    """
+    if len(path) == 1:
+        (k0,) = path
+
+        def get_1(d: Any) -> Any:
+            if _is_mapping(d) and k0 in d:
+                return d[k0]
+            return _MISSING
+
+        return get_1
+
+    if len(path) == 2:
+        k0, k1 = path
+
+        def get_2(d: Any) -> Any:
+            if _is_mapping(d) and k0 in d:
+                parent = d[k0]
+                if _is_mapping(parent) and k1 in parent:
+                    return parent[k1]
+            return _MISSING
+
+        return get_2
+
+    parents, leaf = path[:-1], path[-1]
+
+    def get_n(d: Any) -> Any:
+        current = d
+        for seg in parents:
+            if not _is_mapping(current) or seg not in current:
+                return _MISSING
+            current = current[seg]
+        if _is_mapping(current) and leaf in current:
+            return current[leaf]
+        return _MISSING
+
+    return get_n
 
 
 @dataclass(frozen=True)
@@ -32,6 +86,9 @@ class RequiredFieldSpec:
     validator:
         Optional predicate that returns True when the resolved value is
         considered valid.
+
+    The candidate paths are compiled into getters once, at construction,
+    so that resolve() does no per-call path walking.
     """
 
     module: str
@@ -41,6 +98,25 @@ class RequiredFieldSpec:
     severity: str = "error"
     description: str = ""
     validator: Optional[ValidatorFn] = field(default=None)
+    _compiled_lookup: Tuple[GetterFn, ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        getters = tuple(_compile_path(tuple(p)) for p in self.paths if p)
+        object.__setattr__(self, "_compiled_lookup", getters)
+
+    def resolve(self, raw_config: Any) -> Any:
+        """
+        Return the value at the first candidate path present in raw_config.
+
+        Returns None if no candidate path resolves.
+        """
+        for getter in self._compiled_lookup:
+            val = getter(raw_config)
+            if val is not _MISSING:
+                return val
+        return None
 
 
 # Global registry keyed by module name
@@ -61,10 +137,31 @@ def register_required_fields(
             ...
         ]
         register_required_fields("cashflow", _CASHFLOW_SPECS)
+
+    Idempotent per field name: a spec whose name is already registered for
+    the module replaces the existing entry in place, so re-importing or
+    reloading a registering module does not grow the registry.
+    """
+    registered = _REGISTRY.setdefault(module, [])
+    positions = {spec.name: i for i, spec in enumerate(registered)}
+    for spec in specs:
+        i = positions.get(spec.name)
+        if i is None:
+            positions[spec.name] = len(registered)
+            registered.append(spec)
+        else:
+            registered[i] = spec
+
+
+def get_field_lookup(module: str) -> Dict[str, Tuple[GetterFn, ...]]:
+    """
+    Return the compiled candidate getters for a module, keyed by field name.
+
+    Each getter takes a raw config and returns the value at its path, or a
+    private sentinel when the path does not resolve; RequiredFieldSpec.resolve
+    wraps this for the common "first match" lookup.
     """
-    if module not in _REGISTRY:
-        _REGISTRY[module] = []
-    _REGISTRY[module].extend(specs)
+    return {spec.name: spec._compiled_lookup for spec in _REGISTRY.get(module, [])}
 
 
 def get_required_fields(module: Optional[str] = None) -> List[RequiredFieldSpec]:
@@ -135,7 +232,9 @@ __all__ = [
     "RequiredFieldSpec",
     "register_required_fields",
     "get_required_fields",
+    "get_field_lookup",
     "build_schema_dataframe",
     "ValidatorFn",
     "PathSpec",
+    "GetterFn",
 ]
@@ -8,6 +8,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Sequence
 
+import numpy as np
+
 
 # =============================================================================
 # Phase 1: WACC and Lender Valuation
@@ -87,7 +89,7 @@ class DownsideMetrics:
     max_drawdown: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EquityPerformance:
     """Equity-focused KPI container.
     
@@ -106,3 +108,22 @@ class EquityPerformance:
     downside: Optional[DownsideMetrics] = None
 
 
+@dataclass(slots=True)
+class EquityPerformanceBatch:
+    """EquityPerformance for K scenarios as parallel arrays (one column per KPI).
+
+    Each field is a float64 array of length K; NaN stands in for None. Lets
+    Monte Carlo aggregation run directly on the columns, e.g.
+    np.nanpercentile(batch.equity_irr, 5).
+    """
+
+    equity_irr: np.ndarray
+    equity_npv: np.ndarray
+    moic: np.ndarray
+    dpi: np.ndarray
+    rvpi: np.ndarray
+    tvpi: np.ndarray
+    average_coc: np.ndarray
+    payback_period_years: np.ndarray
+
+
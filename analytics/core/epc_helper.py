@@ -1,9 +1,11 @@
 from finance.epc_helper_v14 import (
     epc_breakdown_from_config,
     epc_breakdown_dict,
+    epc_breakdown_batch,
 )
 
 __all__ = [
     "epc_breakdown_from_config",
     "epc_breakdown_dict",
+    "epc_breakdown_batch",
 ]
\ No newline at end of file
@@ -20,7 +20,7 @@ Usage::
 from __future__ import annotations
 
 import importlib
-from typing import Any, Dict, List, Mapping, Sequence, Tuple
+from typing import Any, Dict, List, Sequence, Tuple
 
 from analytics.config_schema import get_required_fields
 
@@ -61,42 +61,6 @@ def _ensure_module_registered(name: str) -> None:
     importlib.import_module(module_path)
 
 
-# ---------------------------------------------------------------------------
-# Core helpers
-# ---------------------------------------------------------------------------
-
-def _get_nested(container: Mapping[str, Any], path: PathSpec) -> Any:
-    """
-    Walk a nested mapping by path segments.
-
-    Returns the nested value at the end of the path, or None if any segment
-    is missing or not a mapping.
-    """
-    current: Any = container
-    for seg in path:
-        if not isinstance(current, Mapping) or seg not in current:
-            return None
-        current = current[seg]
-    return current
-
-
-def _first_resolved_value(raw_config: Mapping[str, Any], paths: Sequence[PathSpec]) -> Any:
-    """
-    Try each candidate path in order and return the first resolved value.
-
-    Each path is a tuple like ("tax", "corporate_tax_rate_pct").
-    """
-    for path in paths:
-        if not path:
-            continue
-        parent_path = path[:-1]
-        field = path[-1]
-        parent = _get_nested(raw_config, parent_path)
-        if parent is not None and isinstance(parent, Mapping) and field in parent:
-            return parent[field]
-    return None
-
-
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -145,6 +109,7 @@ def validate_config_for_v14(
         # Expected RequiredFieldSpec attributes:
         #   - name: logical field name (e.g. "corporate_tax_rate")
         #   - paths: sequence of candidate PathSpec tuples
+        #   - resolve: callable(config) -> first value found along paths
         #   - required: whether the field must be present
         #   - validator: callable(value) -> bool (optional)
         #   - severity: "error" / "warning" / etc. (we hard-fail only errors)
@@ -158,7 +123,7 @@ def validate_config_for_v14(
             # For now we only enforce error-severity fields at this layer.
             continue
 
-        val = _first_resolved_value(raw_config, paths)
+        val = spec.resolve(raw_config)
         ok = True
 
         # Required check
@@ -10,10 +10,12 @@ from finance.cashflow_v14 import (
     calculate_single_year_cfads,
     build_annual_cfads,
     build_annual_rows,
+    build_annual_rows_columns,
 )
 
 __all__ = [
     "calculate_single_year_cfads",
     "build_annual_cfads",
     "build_annual_rows",
+    "build_annual_rows_columns",
 ]
@@ -9,6 +9,7 @@ from __future__ import annotations
 from finance.irr import (
     npv,
     irr,
+    irr_batch,
     xnpv,
     xirr,
 )
@@ -16,6 +17,7 @@ from finance.irr import (
 __all__ = [
     "npv",
     "irr",
+    "irr_batch",
     "xnpv",
     "xirr",
 ]
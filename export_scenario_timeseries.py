@@ -1,60 +1,136 @@
 import os
-import glob
+import hashlib
 import yaml
 import json
 import csv
-from dutchbay_v14chat.finance.cashflow import build_annual_rows_v14
+from concurrent.futures import ProcessPoolExecutor
+from dutchbay_v14chat.finance.cashflow import build_annual_rows_columns
 from dutchbay_v14chat.finance.debt import apply_debt_layer
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python parser.
+try:
+    from yaml import CSafeLoader as _YLoader
+except ImportError:
+    from yaml import SafeLoader as _YLoader
+
+# orjson is optional; it rejects NaN/Infinity literals, which the stdlib
+# parser accepts, so fall back to json.loads for those documents.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_loads(data):
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+# Parsed YAML configs are cached here as JSON, keyed on path + mtime + size.
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+
+def _yaml_cache_path(path):
+    st = os.stat(path)
+    key = f"{os.path.abspath(path)}:{st.st_mtime_ns}:{st.st_size}"
+    return os.path.join(CACHE_DIR, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+def _load_yaml_cached(path):
+    cache_path = _yaml_cache_path(path)
+    try:
+        with open(cache_path, 'rb') as f:
+            return _json_loads(f.read())
+    except (OSError, ValueError):
+        pass
+    with open(path, 'r') as f:
+        data = yaml.load(f.read(), Loader=_YLoader)
+    # Only cache configs that survive a JSON round-trip unchanged
+    # (no dates, non-string keys, etc.).
+    try:
+        text = json.dumps(data)
+        if json.loads(text) == data:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = cache_path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                f.write(text)
+            os.replace(tmp_path, cache_path)
+    except (TypeError, ValueError, OSError):
+        pass
+    return data
+
 def load_config(path):
     if path.endswith('.json'):
-        with open(path, 'r') as f:
-            return json.load(f)
+        with open(path, 'rb') as f:
+            return _json_loads(f.read())
     elif path.endswith(('.yaml', '.yml')):
-        with open(path, 'r') as f:
-            return yaml.safe_load(f)
+        return _load_yaml_cached(path)
     else:
         raise ValueError("Unsupported file extension: " + path)
 
+SCENARIO_EXTS = ('.json', '.yaml', '.yml')
+
 def get_scenario_files(directory):
-    pats = ['*.json', '*.yaml', '*.yml']
-    files = []
-    for pat in pats:
-        files.extend(glob.glob(os.path.join(directory, pat)))
-    return files
+    # One directory sweep; JSON files first, then YAML, as before. Dotfiles
+    # are skipped to match the previous glob('*.ext') behaviour.
+    with os.scandir(directory) as it:
+        files = [
+            e.path for e in it
+            if e.name.endswith(SCENARIO_EXTS) and not e.name.startswith('.') and e.is_file()
+        ]
+    files.sort(key=lambda p: SCENARIO_EXTS.index(os.path.splitext(p)[1]))
+    # When a scenario exists in both formats, keep only the JSON twin.
+    json_stems = {os.path.splitext(p)[0] for p in files if p.endswith('.json')}
+    return [
+        p for p in files
+        if p.endswith('.json') or os.path.splitext(p)[0] not in json_stems
+    ]
 
-def export_timeseries(directory, outfile="scenario_timeseries.csv"):
-    files = get_scenario_files(directory)
-    all_rows = []
-    for file in files:
-        scen_name = os.path.splitext(os.path.basename(file))[0]
-        try:
-            config = load_config(file)
-            annual_rows = build_annual_rows_v14(config)
-            debt = apply_debt_layer(config, annual_rows)
-            dscr_series = debt.get("dscr_series", [])
-            debt_series = debt.get("debt_outstanding", [])
-            # Assumes annual_rows[year-1] corresponds to each year
-            for i, row in enumerate(annual_rows):
-                rec = {
-                    "scenario": scen_name,
-                    "year": row.get("year", i + 1),
-                    "label": row.get("label", ""),
-                    "revenue_usd": row.get("revenue_usd"),
-                    "opex_usd": row.get("opex_usd"),
-                    "cfads": row.get("cfads_usd"),
-                    "dscr": dscr_series[i] if i < len(dscr_series) else "",
-                    "debt_outstanding": debt_series[i] if i < len(debt_series) else ""
-                }
-                all_rows.append(rec)
-        except Exception as e:
-            print(f"Error exporting {scen_name}: {e}")
+TIMESERIES_COLUMNS = ("scenario", "year", "label", "revenue_usd", "opex_usd", "cfads", "dscr", "debt_outstanding")
+
+def _process_scenario(file):
+    scen_name = os.path.splitext(os.path.basename(file))[0]
+    try:
+        config = load_config(file)
+        cols = build_annual_rows_columns(config, ("year", "revenue_usd", "opex_usd", "cfads_usd"))
+        # The debt layer only reads cfads_usd from each annual row.
+        debt = apply_debt_layer(config, [{"cfads_usd": c} for c in cols["cfads_usd"]])
+        n_years = len(cols["year"])
+        # Assumes annual row i corresponds to year i+1; pad the debt series
+        # (23-period timeline) to the project life once, not per row.
+        dscr_series = (list(debt.get("dscr_series", [])) + [""] * n_years)[:n_years]
+        debt_series = (list(debt.get("debt_outstanding", [])) + [""] * n_years)[:n_years]
+        # Records are positional tuples in TIMESERIES_COLUMNS order.
+        return list(zip(
+            [scen_name] * n_years,
+            cols["year"],
+            [""] * n_years,
+            cols["revenue_usd"],
+            cols["opex_usd"],
+            cols["cfads_usd"],
+            dscr_series,
+            debt_series,
+        ))
+    except Exception as e:
+        print(f"Error exporting {scen_name}: {e}")
+        return []
 
-    keys = ["scenario", "year", "label", "revenue_usd", "opex_usd", "cfads", "dscr", "debt_outstanding"]
+def export_timeseries(directory, outfile="scenario_timeseries.csv", workers=None):
+    files = get_scenario_files(directory)
+    workers = workers or os.cpu_count() or 1
+    # Rows are written as each scenario finishes, so memory is bounded by
+    # one scenario's rows rather than the whole sweep.
     with open(outfile, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=keys)
-        writer.writeheader()
-        writer.writerows(all_rows)
+        writer = csv.writer(f)
+        writer.writerow(TIMESERIES_COLUMNS)
+        if workers > 1 and len(files) > 1:
+            # Scenarios are independent: fan out across processes, keep file order.
+            with ProcessPoolExecutor(max_workers=min(workers, len(files))) as ex:
+                for rows in ex.map(_process_scenario, files, chunksize=4):
+                    writer.writerows(rows)
+        else:
+            for file in files:
+                writer.writerows(_process_scenario(file))
     print(f"Full annual timeseries exported to: {outfile}")
 
 if __name__ == "__main__":
@@ -62,7 +138,8 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Export all scenario timeseries to long-format CSV")
     parser.add_argument("--dir", "-d", type=str, required=True, help="Scenario directory")
     parser.add_argument("--csv", "-o", type=str, default="scenario_timeseries.csv", help="Output CSV filename")
+    parser.add_argument("--workers", "-j", type=int, default=None, help="Worker processes (default: CPU count; 1 = serial)")
     args = parser.parse_args()
-    export_timeseries(args.dir, args.csv)
+    export_timeseries(args.dir, args.csv, workers=args.workers)
 
 
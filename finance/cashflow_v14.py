@@ -20,10 +20,20 @@ FEATURES & TAX/DEPRECIATION LOGIC:
 from __future__ import annotations
 
 import logging
+import math
+from collections.abc import Mapping, Sequence
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 from analytics.config_schema import RequiredFieldSpec, register_required_fields
 
+# Optional JIT for the annual CFADS kernel; the NumPy path is used without it.
+try:  # pragma: no cover - env dependent
+    import numba  # type: ignore
+except Exception:  # pragma: no cover
+    numba = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -193,6 +203,22 @@ def _compute_depreciation_schedule(
     return [annual] * depreciation_years
 
 
+def _depreciation_for_year(
+    capex_total: Optional[float],
+    depreciation_years: int,
+    enhanced_capital_allowance_pct: float,
+    year_index: int,
+) -> float:
+    """
+    Straight-line depreciation for a single year, without building the schedule.
+    """
+    if capex_total is None or depreciation_years <= 0:
+        return 0.0
+    if year_index >= depreciation_years:
+        return 0.0
+    return capex_total * enhanced_capital_allowance_pct / depreciation_years
+
+
 def calculate_tax_with_interest_shield(
     pretax_cfads: float,
     corporate_tax_rate: float,
@@ -221,19 +247,12 @@ def calculate_tax_with_interest_shield(
         end = start + tax_holiday_years - 1
         in_holiday = start <= current_year <= end
 
-    if capex_total is None or depreciation_years <= 0:
-        depreciation_schedule: List[float] = []
-    else:
-        depreciation_schedule = _compute_depreciation_schedule(
-            capex_total,
-            depreciation_years,
-            enhanced_capital_allowance_pct,
-        )
-
-    if year_index < len(depreciation_schedule):
-        depreciation_for_year = depreciation_schedule[year_index]
-    else:
-        depreciation_for_year = 0.0
+    depreciation_for_year = _depreciation_for_year(
+        capex_total,
+        depreciation_years,
+        enhanced_capital_allowance_pct,
+        year_index,
+    )
 
     if in_holiday:
         # During BOI tax holiday, tax is zero regardless of taxable income.
@@ -326,40 +345,34 @@ def _extract_project_life_years(raw: Dict[str, Any]) -> int:
             logger.info("Project life resolved from %s = %d years", label, v)
             return v
 
-    hits: List[Tuple[str, int]] = []
-
-    from collections.abc import Mapping, Sequence
-
-    def walk(node: Any, path: Tuple[str, ...]) -> None:
+    # Iterative pre-order DFS: same visit order as a recursive walk, so the
+    # first plausible hit is unchanged, but no call frame per node and we
+    # stop as soon as a hit is found.
+    stack: List[Tuple[Any, Tuple[str, ...]]] = [(raw, ())]
+    while stack:
+        node, path = stack.pop()
         if isinstance(node, Mapping):
-            for k, v in node.items():
-                walk(v, path + (str(k),))
+            children = [(v, path + (str(k),)) for k, v in node.items()]
+            stack.extend(reversed(children))
         elif isinstance(node, Sequence) and not isinstance(node, (str, bytes)):
-            for idx, item in enumerate(node):
-                walk(item, path + (f"[{idx}]",))
+            children = [(item, path + (f"[{idx}]",)) for idx, item in enumerate(node)]
+            stack.extend(reversed(children))
         else:
             iv = as_int_or_none(node)
-            if iv is None:
-                return
-            if not (5 <= iv <= 60):
-                return
-            path_str = "/".join(path).lower()
+            if iv is None or not (5 <= iv <= 60):
+                continue
+            path_str = "/".join(path)
+            lowered = path_str.lower()
             if any(
-                t in path_str
+                t in lowered
                 for t in ("life", "lifetime", "horizon", "year", "yrs")
             ):
-                hits.append(("/".join(path), iv))
-
-    walk(raw, ())
-
-    if hits:
-        chosen_path, chosen_val = hits[0]
-        logger.warning(
-            "Project life not found in explicit fields; using heuristic match %r = %d years",
-            chosen_path,
-            chosen_val,
-        )
-        return chosen_val
+                logger.warning(
+                    "Project life not found in explicit fields; using heuristic match %r = %d years",
+                    path_str,
+                    iv,
+                )
+                return iv
 
     raise ValueError(
         "Missing or invalid project life: expected one of "
@@ -369,6 +382,134 @@ def _extract_project_life_years(raw: Dict[str, Any]) -> int:
     )
 
 
+# Candidate config paths per normalized parameter, in priority order. Each path
+# is one or two keys deep; the first non-None value wins.
+_PARAM_PATHS: Dict[str, Tuple[Tuple[str, ...], ...]] = {
+    "capacity_mw": (
+        ("project", "capacity_mw"),
+        ("project", "capacity"),
+        ("parameters", "capacity_mw"),
+        ("capacity_mw",),
+    ),
+    "capacity_factor": (
+        ("project", "capacity_factor_pct"),
+        ("project", "capacity_factor"),
+        ("parameters", "capacity_factor_pct"),
+        ("parameters", "capacity_factor"),
+        ("capacity_factor_pct",),
+        ("capacity_factor",),
+    ),
+    "degradation": (
+        ("project", "degradation_pct"),
+        ("project", "degradation"),
+        ("parameters", "degradation_pct"),
+        ("parameters", "degradation"),
+        ("degradation_pct",),
+        ("degradation",),
+    ),
+    "grid_loss_pct": (
+        ("project", "grid_loss_pct"),
+        ("parameters", "grid_loss_pct"),
+        ("grid_loss_pct",),
+    ),
+    "tariff_lkr_per_kwh": (
+        ("tariff", "lkr_per_kwh"),
+        ("tariff", "lkr_kwh"),
+        ("tariff", "tariff_lkr_per_kwh"),
+        ("revenue", "tariff_lkr_per_kwh"),
+        ("tariff_lkr_per_kwh",),
+        ("tariff_lkr",),
+        ("tariff",),
+    ),
+    "opex_usd_per_year": (
+        ("opex", "usd_per_year"),
+        ("opex", "usd_annual"),
+        ("opex", "annual_opex_usd"),
+        ("costs", "opex_usd_per_year"),
+        ("opex_usd_per_year",),
+    ),
+    "success_fee_pct": (
+        ("statutory", "success_fee_pct"),
+        ("statutory", "success_fee"),
+        ("parameters", "success_fee_pct"),
+        ("success_fee_pct",),
+        ("success_fee",),
+    ),
+    "env_surcharge_pct": (
+        ("statutory", "env_surcharge_pct"),
+        ("statutory", "environmental_surcharge_pct"),
+        ("parameters", "env_surcharge_pct"),
+        ("env_surcharge_pct",),
+        ("environmental_surcharge_pct",),
+    ),
+    "social_levy_pct": (
+        ("statutory", "social_levy_pct"),
+        ("statutory", "social_services_levy_pct"),
+        ("parameters", "social_levy_pct"),
+        ("social_levy_pct",),
+        ("social_services_levy_pct",),
+    ),
+    "corporate_tax_rate": (
+        ("tax", "corporate_tax_rate_pct"),
+        ("tax", "corporate_tax_rate"),
+        ("project", "corporate_tax_rate_pct"),
+        ("project", "corporate_tax_rate"),
+        ("parameters", "corporate_tax_rate_pct"),
+        ("parameters", "corporate_tax_rate"),
+        ("corporate_tax_rate_pct",),
+        ("corporate_tax_rate",),
+    ),
+    "depreciation_years": (
+        ("tax", "depreciation_years"),
+        ("parameters", "depreciation_years"),
+        ("depreciation_years",),
+    ),
+    "tax_holiday_years": (
+        ("tax", "holiday_years"),
+        ("tax", "tax_holiday_years"),
+        ("parameters", "tax_holiday_years"),
+        ("tax_holiday_years",),
+    ),
+    "tax_holiday_start_year": (
+        ("tax", "holiday_start_year"),
+        ("tax", "tax_holiday_start_year"),
+        ("parameters", "tax_holiday_start_year"),
+        ("tax_holiday_start_year",),
+    ),
+    "enhanced_capital_allowance_pct": (
+        ("tax", "enhanced_capital_allowance_pct"),
+        ("parameters", "enhanced_capital_allowance_pct"),
+        ("enhanced_capital_allowance_pct",),
+    ),
+    "risk_haircut_pct": (
+        ("risk", "haircut_pct"),
+        ("parameters", "risk_haircut_pct"),
+        ("risk_haircut_pct",),
+        ("risk_haircut",),
+    ),
+}
+
+
+def _resolve_params(cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Resolve every _PARAM_PATHS entry against `cfg` in a single pass.
+
+    Equivalent to calling _resolve_first once per parameter, with the
+    one/two-level dict descents inlined.
+    """
+    resolved: Dict[str, Any] = {}
+    for name, paths in _PARAM_PATHS.items():
+        val = None
+        for path in paths:
+            val = cfg.get(path[0])
+            if len(path) > 1:
+                val = val.get(path[1]) if isinstance(val, dict) else None
+            if val is not None:
+                break
+        resolved[name] = val
+    return resolved
+
+
 def _extract_parameters(raw: Dict[str, Any]) -> Dict[str, Any]:
     """
     Extract and normalize parameters required for v14 CFADS calculation.
@@ -377,172 +518,35 @@ def _extract_parameters(raw: Dict[str, Any]) -> Dict[str, Any]:
     # Project life (hard fail if absent)
     project_life_years = _extract_project_life_years(raw)
 
-    # Core project properties
-    capacity_mw = _as_float_or_none(
-        _resolve_first(
-            raw,
-            ("project", "capacity_mw"),
-            ("project", "capacity"),
-            ("parameters", "capacity_mw"),
-            "capacity_mw",
-        )
-    )
+    resolved = _resolve_params(raw)
 
-    capacity_factor_raw = _as_float_or_none(
-        _resolve_first(
-            raw,
-            ("project", "capacity_factor_pct"),
-            ("project", "capacity_factor"),
-            ("parameters", "capacity_factor_pct"),
-            ("parameters", "capacity_factor"),
-            "capacity_factor_pct",
-            "capacity_factor",
-        )
-    )
-    capacity_factor = _pct_to_decimal(capacity_factor_raw)
-
-    degradation_raw = _as_float_or_none(
-        _resolve_first(
-            raw,
-            ("project", "degradation_pct"),
-            ("project", "degradation"),
-            ("parameters", "degradation_pct"),
-            ("parameters", "degradation"),
-            "degradation_pct",
-            "degradation",
-        )
-    )
-    degradation = _pct_to_decimal(degradation_raw) or 0.0
-
-    grid_loss_raw = _as_float_or_none(
-        _resolve_first(
-            raw,
-            ("project", "grid_loss_pct"),
-            ("parameters", "grid_loss_pct"),
-            "grid_loss_pct",
-        )
-    )
-    grid_loss_pct = _pct_to_decimal(grid_loss_raw) or 0.0
+    # Core project properties
+    capacity_mw = _as_float_or_none(resolved["capacity_mw"])
+    capacity_factor = _pct_to_decimal(_as_float_or_none(resolved["capacity_factor"]))
+    degradation = _pct_to_decimal(_as_float_or_none(resolved["degradation"])) or 0.0
+    grid_loss_pct = _pct_to_decimal(_as_float_or_none(resolved["grid_loss_pct"])) or 0.0
 
     # Tariff (LKR per kWh)
-    tariff_raw = _as_float_or_none(
-        _resolve_first(
-            raw,
-            ("tariff", "lkr_per_kwh"),
-            ("tariff", "lkr_kwh"),
-            ("tariff", "tariff_lkr_per_kwh"),
-            ("revenue", "tariff_lkr_per_kwh"),
-            "tariff_lkr_per_kwh",
-            "tariff_lkr",
-            "tariff",
-        )
-    )
-    tariff_lkr_per_kwh = tariff_raw
+    tariff_lkr_per_kwh = _as_float_or_none(resolved["tariff_lkr_per_kwh"])
 
     # OPEX (USD per year)
-    opex_usd_per_year = _as_float_or_none(
-        _resolve_first(
-            raw,
-            ("opex", "usd_per_year"),
-            ("opex", "usd_annual"),
-            ("opex", "annual_opex_usd"),
-            ("costs", "opex_usd_per_year"),
-            "opex_usd_per_year",
-        )
-    )
+    opex_usd_per_year = _as_float_or_none(resolved["opex_usd_per_year"])
 
     # Statutory deductions
-    success_fee_raw = _as_float_or_none(
-        _resolve_first(
-            raw,
-            ("statutory", "success_fee_pct"),
-            ("statutory", "success_fee"),
-            ("parameters", "success_fee_pct"),
-            "success_fee_pct",
-            "success_fee",
-        )
-    )
-    success_fee_pct = _pct_to_decimal(success_fee_raw) or 0.0
-
-    env_surcharge_raw = _as_float_or_none(
-        _resolve_first(
-            raw,
-            ("statutory", "env_surcharge_pct"),
-            ("statutory", "environmental_surcharge_pct"),
-            ("parameters", "env_surcharge_pct"),
-            "env_surcharge_pct",
-            "environmental_surcharge_pct",
-        )
+    success_fee_pct = _pct_to_decimal(_as_float_or_none(resolved["success_fee_pct"])) or 0.0
+    env_surcharge_pct = (
+        _pct_to_decimal(_as_float_or_none(resolved["env_surcharge_pct"])) or 0.0
     )
-    env_surcharge_pct = _pct_to_decimal(env_surcharge_raw) or 0.0
-
-    social_levy_raw = _as_float_or_none(
-        _resolve_first(
-            raw,
-            ("statutory", "social_levy_pct"),
-            ("statutory", "social_services_levy_pct"),
-            ("parameters", "social_levy_pct"),
-            "social_levy_pct",
-            "social_services_levy_pct",
-        )
-    )
-    social_levy_pct = _pct_to_decimal(social_levy_raw) or 0.0
+    social_levy_pct = _pct_to_decimal(_as_float_or_none(resolved["social_levy_pct"])) or 0.0
 
     # Tax / BOI structure
-    corporate_tax_raw = _as_float_or_none(
-        _resolve_first(
-            raw,
-            ("tax", "corporate_tax_rate_pct"),
-            ("tax", "corporate_tax_rate"),
-            ("project", "corporate_tax_rate_pct"),
-            ("project", "corporate_tax_rate"),
-            ("parameters", "corporate_tax_rate_pct"),
-            ("parameters", "corporate_tax_rate"),
-            "corporate_tax_rate_pct",
-            "corporate_tax_rate",
-        )
-    )
-    corporate_tax_rate = _pct_to_decimal(corporate_tax_raw)
-
-    depreciation_years = as_int(
-        _resolve_first(
-            raw,
-            ("tax", "depreciation_years"),
-            ("parameters", "depreciation_years"),
-            "depreciation_years",
-        ),
-        default=20,
-    ) or 20
-
-    tax_holiday_years = as_int(
-        _resolve_first(
-            raw,
-            ("tax", "holiday_years"),
-            ("tax", "tax_holiday_years"),
-            ("parameters", "tax_holiday_years"),
-            "tax_holiday_years",
-        ),
-        default=0,
-    ) or 0
-
-    tax_holiday_start_year = as_int(
-        _resolve_first(
-            raw,
-            ("tax", "holiday_start_year"),
-            ("tax", "tax_holiday_start_year"),
-            ("parameters", "tax_holiday_start_year"),
-            "tax_holiday_start_year",
-        ),
-        default=1,
-    ) or 1
+    corporate_tax_rate = _pct_to_decimal(_as_float_or_none(resolved["corporate_tax_rate"]))
+    depreciation_years = as_int(resolved["depreciation_years"], default=20) or 20
+    tax_holiday_years = as_int(resolved["tax_holiday_years"], default=0) or 0
+    tax_holiday_start_year = as_int(resolved["tax_holiday_start_year"], default=1) or 1
 
     enhanced_capital_allowance_raw = _as_float_or_none(
-        _resolve_first(
-            raw,
-            ("tax", "enhanced_capital_allowance_pct"),
-            ("parameters", "enhanced_capital_allowance_pct"),
-            "enhanced_capital_allowance_pct",
-        )
+        resolved["enhanced_capital_allowance_pct"]
     )
     if enhanced_capital_allowance_raw and enhanced_capital_allowance_raw > 1:
         enhanced_capital_allowance_pct = enhanced_capital_allowance_raw / 100.0
@@ -550,16 +554,7 @@ def _extract_parameters(raw: Dict[str, Any]) -> Dict[str, Any]:
         enhanced_capital_allowance_pct = enhanced_capital_allowance_raw or 1.0
 
     # Risk haircut
-    risk_haircut_raw = _as_float_or_none(
-        _resolve_first(
-            raw,
-            ("risk", "haircut_pct"),
-            ("parameters", "risk_haircut_pct"),
-            "risk_haircut_pct",
-            "risk_haircut",
-        )
-    )
-    risk_haircut_pct = _pct_to_decimal(risk_haircut_raw) or 0.0
+    risk_haircut_pct = _pct_to_decimal(_as_float_or_none(resolved["risk_haircut_pct"])) or 0.0
 
     params: Dict[str, Any] = {
         "project_life_years": project_life_years,
@@ -581,33 +576,18 @@ def _extract_parameters(raw: Dict[str, Any]) -> Dict[str, Any]:
     }
 
     missing_or_invalid: List[str] = []
-
-    def _check_required(name: str, predicate: Any) -> None:
-        val = params.get(name, None)
-        if not predicate(val):
-            missing_or_invalid.append(name)
-
-    _check_required("project_life_years", lambda v: isinstance(v, int) and v > 0)
-    _check_required(
-        "capacity_mw",
-        lambda v: isinstance(v, (int, float)) and v is not None and v > 0,
-    )
-    _check_required(
-        "capacity_factor",
-        lambda v: isinstance(v, (int, float)) and 0 < v <= 1,
-    )
-    _check_required(
-        "tariff_lkr_per_kwh",
-        lambda v: isinstance(v, (int, float)) and v > 0,
-    )
-    _check_required(
-        "opex_usd_per_year",
-        lambda v: isinstance(v, (int, float)) and v >= 0,
-    )
-    _check_required(
-        "corporate_tax_rate",
-        lambda v: isinstance(v, (int, float)) and v 
-    )
+    if not (isinstance(project_life_years, int) and project_life_years > 0):
+        missing_or_invalid.append("project_life_years")
+    if not (isinstance(capacity_mw, (int, float)) and capacity_mw > 0):
+        missing_or_invalid.append("capacity_mw")
+    if not (isinstance(capacity_factor, (int, float)) and 0 < capacity_factor <= 1):
+        missing_or_invalid.append("capacity_factor")
+    if not (isinstance(tariff_lkr_per_kwh, (int, float)) and tariff_lkr_per_kwh > 0):
+        missing_or_invalid.append("tariff_lkr_per_kwh")
+    if not (isinstance(opex_usd_per_year, (int, float)) and opex_usd_per_year >= 0):
+        missing_or_invalid.append("opex_usd_per_year")
+    if not (isinstance(corporate_tax_rate, (int, float)) and corporate_tax_rate):
+        missing_or_invalid.append("corporate_tax_rate")
 
     if missing_or_invalid:
         raise ValueError(
@@ -692,14 +672,222 @@ def calculate_single_year_cfads(
     return result
 
 
-def build_annual_cfads(
+def _series(values: Sequence[float], years: int, fill: float) -> np.ndarray:
+    """Fit a per-year series to `years`, padding the tail with `fill`."""
+    out = np.full(years, fill, dtype=float)
+    n = min(len(values), years)
+    if n:
+        out[:n] = values[:n]
+    return out
+
+
+def _net_production_series(params: Dict[str, Any], years: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorised _calculate_net_production: gross and net kWh for years 0..years-1.
+    """
+    effective_cf = float(params["capacity_factor"]) * np.power(
+        1 - float(params["degradation"]), np.arange(years)
+    )
+    gross_kwh = float(params["capacity_mw"]) * 1e3 * 8760 * effective_cf
+    net_kwh = gross_kwh - gross_kwh * float(params["grid_loss_pct"])
+    return gross_kwh, net_kwh
+
+
+def _cfads_vector(
+    params: Dict[str, Any],
+    fx_curve: List[float],
+    capex_total: Optional[float],
+    interest_expense_series: List[float],
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorised equivalent of calculate_single_year_cfads over all project years.
+
+    Returns one float64 array per output field, keyed as in the single-year row.
+    """
+    years = int(params["project_life_years"])
+    year_idx = np.arange(years)
+    fx = _series(fx_curve, years, fx_curve[-1])
+    interest = _series(interest_expense_series, years, 0.0)
+
+    # Production and revenue
+    gross_kwh, net_kwh = _net_production_series(params, years)
+    revenue_lkr = net_kwh * float(params["tariff_lkr_per_kwh"])
+
+    # Statutory deductions and OPEX
+    success_fee = revenue_lkr * float(params["success_fee_pct"])
+    env_surcharge = revenue_lkr * float(params["env_surcharge_pct"])
+    social_levy = revenue_lkr * float(params["social_levy_pct"])
+    total_statutory = success_fee + env_surcharge + social_levy
+    opex_usd = float(params["opex_usd_per_year"])
+    opex_lkr = opex_usd * fx
+    pretax_cfads = revenue_lkr - total_statutory - opex_lkr
+
+    # Tax with depreciation + interest shield and BOI holiday window.
+    # A zero tax rate reports no depreciation, matching the single-year path.
+    corporate_tax_rate = float(params["corporate_tax_rate"])
+    depreciation = np.zeros(years)
+    if corporate_tax_rate > 0.0:
+        schedule = _compute_depreciation_schedule(
+            capex_total,
+            int(params["depreciation_years"]),
+            float(params.get("enhanced_capital_allowance_pct", 1.0)),
+        )
+        n = min(len(schedule), years)
+        depreciation[:n] = schedule[:n]
+    taxable_income = np.maximum(0.0, pretax_cfads - depreciation - interest)
+
+    holiday_years = int(params.get("tax_holiday_years", 0))
+    if corporate_tax_rate <= 0.0:
+        tax = np.zeros(years)
+    elif holiday_years > 0:
+        start = int(params.get("tax_holiday_start_year", 1))
+        current_year = year_idx + 1
+        holiday_mask = (current_year >= start) & (current_year <= start + holiday_years - 1)
+        tax = np.where(holiday_mask, 0.0, taxable_income * corporate_tax_rate)
+    else:
+        tax = taxable_income * corporate_tax_rate
+
+    posttax_cfads = pretax_cfads - tax
+    cfads_final = posttax_cfads * (1 - float(params["risk_haircut_pct"]))
+
+    return {
+        "year": year_idx + 1.0,
+        "gross_kwh": gross_kwh,
+        "grid_loss": gross_kwh - net_kwh,
+        "net_kwh": net_kwh,
+        "revenue_lkr": revenue_lkr,
+        "success_fee": success_fee,
+        "env_surcharge": env_surcharge,
+        "social_levy": social_levy,
+        "total_statutory_deductions": total_statutory,
+        "opex_usd": np.full(years, opex_usd),
+        "fx_rate": fx,
+        "opex_lkr": opex_lkr,
+        "pretax_cfads": pretax_cfads,
+        "total_depreciation": depreciation,
+        "interest_expense_lkr": interest,
+        "taxable_income": taxable_income,
+        "tax": tax,
+        "posttax_cfads": posttax_cfads,
+        "risk_haircut_amount": posttax_cfads - cfads_final,
+        "cfads_final_lkr": cfads_final,
+    }
+
+
+def _cfads_kernel_py(
+    capacity_mw: float,
+    capacity_factor: float,
+    degradation: float,
+    grid_loss_pct: float,
+    tariff_lkr_per_kwh: float,
+    opex_usd_per_year: float,
+    success_fee_pct: float,
+    env_surcharge_pct: float,
+    social_levy_pct: float,
+    corporate_tax_rate: float,
+    depreciation_years: int,
+    capex_total: float,
+    enhanced_capital_allowance_pct: float,
+    tax_holiday_start_year: int,
+    tax_holiday_years: int,
+    risk_haircut_pct: float,
+    fx: np.ndarray,
+    interest: np.ndarray,
+) -> np.ndarray:
+    """
+    Scalar-loop CFADS (LKR) kernel mirroring calculate_single_year_cfads.
+
+    Written against plain floats/arrays so it can be compiled with Numba;
+    `capex_total` is NaN when no capex is available for depreciation.
+    """
+    years = fx.shape[0]
+    out = np.empty(years)
+    annual_depr = 0.0
+    if not math.isnan(capex_total) and depreciation_years > 0:
+        annual_depr = capex_total * enhanced_capital_allowance_pct / depreciation_years
+    holiday_end = tax_holiday_start_year + tax_holiday_years - 1
+    for y in range(years):
+        effective_cf = capacity_factor * (1 - degradation) ** y
+        gross_kwh = capacity_mw * 1e3 * 8760 * effective_cf
+        net_kwh = gross_kwh - gross_kwh * grid_loss_pct
+        revenue = net_kwh * tariff_lkr_per_kwh
+        statutory = (
+            revenue * success_fee_pct
+            + revenue * env_surcharge_pct
+            + revenue * social_levy_pct
+        )
+        pretax = revenue - statutory - opex_usd_per_year * fx[y]
+        tax = 0.0
+        if corporate_tax_rate > 0.0:
+            current_year = y + 1
+            in_holiday = (
+                tax_holiday_years > 0
+                and tax_holiday_start_year <= current_year <= holiday_end
+            )
+            if not in_holiday:
+                depr = annual_depr if y < depreciation_years else 0.0
+                tax = max(0.0, pretax - depr - interest[y]) * corporate_tax_rate
+        out[y] = (pretax - tax) * (1 - risk_haircut_pct)
+    return out
+
+
+if numba is not None:  # pragma: no cover - env dependent
+    _cfads_kernel = numba.njit(
+        "f8[:](f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, i8, f8, f8, i8, i8, f8, f8[:], f8[:])",
+        cache=True,
+    )(_cfads_kernel_py)
+else:
+    _cfads_kernel = None
+
+
+def _cfads_final_lkr(
+    params: Dict[str, Any],
+    fx_curve: List[float],
+    capex_total: Optional[float],
+    interest_expense_series: List[float],
+) -> np.ndarray:
+    """CFADS (LKR) per year, via the JIT kernel when Numba is importable."""
+    if _cfads_kernel is None:
+        return _cfads_vector(params, fx_curve, capex_total, interest_expense_series)[
+            "cfads_final_lkr"
+        ]
+    years = int(params["project_life_years"])
+    return _cfads_kernel(
+        float(params["capacity_mw"]),
+        float(params["capacity_factor"]),
+        float(params["degradation"]),
+        float(params["grid_loss_pct"]),
+        float(params["tariff_lkr_per_kwh"]),
+        float(params["opex_usd_per_year"]),
+        float(params["success_fee_pct"]),
+        float(params["env_surcharge_pct"]),
+        float(params["social_levy_pct"]),
+        float(params["corporate_tax_rate"]),
+        int(params["depreciation_years"]),
+        float("nan") if capex_total is None else float(capex_total),
+        float(params.get("enhanced_capital_allowance_pct", 1.0)),
+        int(params.get("tax_holiday_start_year", 1)),
+        int(params.get("tax_holiday_years", 0)),
+        float(params["risk_haircut_pct"]),
+        _series(fx_curve, years, fx_curve[-1]),
+        _series(interest_expense_series, years, 0.0),
+    )
+
+
+def _rows_from_vector(vec: Dict[str, np.ndarray]) -> List[Dict[str, float]]:
+    """Zip the per-field arrays into per-year row dicts of plain floats."""
+    keys = list(vec)
+    columns = [vec[k].tolist() for k in keys]
+    return [dict(zip(keys, values)) for values in zip(*columns)]
+
+
+def _prepare_inputs(
     p: Dict[str, Any],
-    fx_curve: Optional[List[float]] = None,
-    capex_total: Optional[float] = None,
-    interest_expense_series: Optional[List[float]] = None,
-    verbose: bool = False,
-) -> List[float]:
-    """Return list of CFADS (LKR) for each project year."""
+    fx_curve: Optional[List[float]],
+    capex_total: Optional[float],
+    interest_expense_series: Optional[List[float]],
+) -> Tuple[Dict[str, Any], List[float], Optional[float], List[float]]:
+    """Normalize params and fill in the default FX curve, capex and interest series."""
     params = _extract_parameters(p)
     years = int(params["project_life_years"])
     if fx_curve is None:
@@ -710,24 +898,52 @@ def build_annual_cfads(
             capex_total = capex_usd * fx_curve[0]
     if interest_expense_series is None:
         interest_expense_series = [0.0] * years
+    return params, fx_curve, capex_total, interest_expense_series
+
+
+def _compute_all(
+    p: Dict[str, Any],
+    fx_curve: Optional[List[float]] = None,
+    capex_total: Optional[float] = None,
+    interest_expense_series: Optional[List[float]] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Full per-year CFADS breakdown as arrays, including USD revenue and CFADS.
+
+    Shared by build_annual_rows and build_annual_rows_columns.
+    """
+    vec = _cfads_vector(*_prepare_inputs(p, fx_curve, capex_total, interest_expense_series))
+    fx = vec["fx_rate"]
+    positive_fx = fx > 0
+    # Divide only where FX is positive; other years stay at the 0.0 fill.
+    vec["revenue_usd"] = np.divide(
+        vec["revenue_lkr"], fx, out=np.zeros_like(fx), where=positive_fx
+    )
+    vec["cfads_usd"] = np.divide(
+        vec["cfads_final_lkr"], fx, out=np.zeros_like(fx), where=positive_fx
+    )
+    return vec
 
-    cfads_list: List[float] = []
-    for year in range(years):
-        fx_rate = fx_curve[year] if year < len(fx_curve) else fx_curve[-1]
-        interest_lkr = (
-            interest_expense_series[year]
-            if year < len(interest_expense_series)
-            else 0.0
-        )
-        result = calculate_single_year_cfads(
-            params=params,
-            fx_rate=fx_rate,
-            year=year,
-            capex_total=capex_total,
-            interest_expense_lkr=interest_lkr,
-            verbose=verbose,
-        )
-        cfads_list.append(result["cfads_final_lkr"])
+
+def build_annual_cfads(
+    p: Dict[str, Any],
+    fx_curve: Optional[List[float]] = None,
+    capex_total: Optional[float] = None,
+    interest_expense_series: Optional[List[float]] = None,
+    verbose: bool = False,
+) -> List[float]:
+    """Return list of CFADS (LKR) for each project year."""
+    inputs = _prepare_inputs(p, fx_curve, capex_total, interest_expense_series)
+    years = int(inputs[0]["project_life_years"])
+
+    if verbose:
+        vec = _cfads_vector(*inputs)
+        for row in _rows_from_vector(vec):
+            logger.info("Year %d CFADS: %s", int(row["year"]), row)
+        cfads = vec["cfads_final_lkr"]
+    else:
+        cfads = _cfads_final_lkr(*inputs)
+    cfads_list: List[float] = cfads.tolist()
 
     logger.info(
         "Calculated CFADS for %d years, range: %.0f to %.0f",
@@ -745,43 +961,26 @@ def build_annual_rows(
     interest_expense_series: Optional[List[float]] = None,
 ) -> List[Dict[str, float]]:
     """Return list of per-year breakdown rows including CFADS in USD."""
-    params = _extract_parameters(p)
-    years = int(params["project_life_years"])
-    if fx_curve is None:
-        fx_curve = _fx_curve(p, years)
-    if capex_total is None:
-        capex_usd = as_float(get_nested(p, ["capex", "usd_total"], None))
-        if capex_usd is not None:
-            capex_total = capex_usd * fx_curve[0]
-    if interest_expense_series is None:
-        interest_expense_series = [0.0] * years
+    return _rows_from_vector(_compute_all(p, fx_curve, capex_total, interest_expense_series))
 
-    rows: List[Dict[str, float]] = []
-    for year in range(years):
-        fx_rate = fx_curve[year] if year < len(fx_curve) else fx_curve[-1]
-        interest_lkr = (
-            interest_expense_series[year]
-            if year < len(interest_expense_series)
-            else 0.0
-        )
-        result = calculate_single_year_cfads(
-            params=params,
-            fx_rate=fx_rate,
-            year=year,
-            capex_total=capex_total,
-            interest_expense_lkr=interest_lkr,
-            verbose=False,
-        )
-        revenue_lkr = result["revenue_lkr"]
-        cfads_final_lkr = result["cfads_final_lkr"]
-        if fx_rate > 0:
-            result["revenue_usd"] = revenue_lkr / fx_rate
-            result["cfads_usd"] = cfads_final_lkr / fx_rate
-        else:
-            result["revenue_usd"] = 0.0
-            result["cfads_usd"] = 0.0
-        rows.append(result)
-    return rows
+
+def build_annual_rows_columns(
+    p: Dict[str, Any],
+    columns: Sequence[str],
+    fx_curve: Optional[List[float]] = None,
+    capex_total: Optional[float] = None,
+    interest_expense_series: Optional[List[float]] = None,
+) -> Dict[str, List[float]]:
+    """
+    Column-oriented subset of build_annual_rows: {column: per-year values}.
+
+    For callers that only need a few fields; no per-year row dicts are built.
+    """
+    vec = _compute_all(p, fx_curve, capex_total, interest_expense_series)
+    unknown = [c for c in columns if c not in vec]
+    if unknown:
+        raise ValueError("Unknown annual row column(s): " + ", ".join(unknown))
+    return {c: vec[c].tolist() for c in columns}
 
 
 # =============================================================================
@@ -789,128 +988,157 @@ def build_annual_rows(
 # =============================================================================
 
 
-def _register_cashflow_schema() -> None:
-    """
-    Register the core v14 cashflow-required fields with the global schema
-    registry. Mirrors the checks in _extract_parameters.
-    """
-    specs = [
-        RequiredFieldSpec(
-            module="cashflow",
-            name="project_life_years",
-            paths=(
-                ("project", "project_life_years"),
-                ("project", "life_years"),
-                ("parameters", "project_life_years"),
-                ("Financing_Terms", "tenor_years"),
-            ),
-            required=True,
-            severity="error",
-            description="Project life in years; drives CFADS horizon.",
-            validator=lambda v: isinstance(v, int) and v > 0,
+# Shared spec validators. A plain isinstance check: bool and np.float64 pass,
+# numpy integer scalars do not.
+
+
+def _is_number(v: Any) -> bool:
+    return isinstance(v, (int, float))
+
+
+def _v_positive_int(v: Any) -> bool:
+    return isinstance(v, int) and v > 0
+
+
+def _v_positive_number(v: Any) -> bool:
+    return _is_number(v) and v > 0.0
+
+
+def _v_non_negative_number(v: Any) -> bool:
+    return _is_number(v) and v >= 0.0
+
+
+def _v_pct_positive(v: Any) -> bool:
+    """0 < v <= 100 (percent or decimal)."""
+    return _is_number(v) and 0.0 < v <= 100.0
+
+
+def _v_pct(v: Any) -> bool:
+    """0 <= v <= 100 (percent or decimal)."""
+    return _is_number(v) and 0.0 <= v <= 100.0
+
+
+_CASHFLOW_SPECS: Tuple[RequiredFieldSpec, ...] = (
+    RequiredFieldSpec(
+        module="cashflow",
+        name="project_life_years",
+        paths=(
+            ("project", "project_life_years"),
+            ("project", "life_years"),
+            ("parameters", "project_life_years"),
+            ("Financing_Terms", "tenor_years"),
         ),
-        RequiredFieldSpec(
-            module="cashflow",
-            name="capacity_mw",
-            paths=(
-                ("project", "capacity_mw"),
-                ("project", "capacity"),
-                ("parameters", "capacity_mw"),
-                ("parameters", "capacity"),
-            ),
-            required=True,
-            severity="error",
-            description="Net installed capacity in MW.",
-            validator=lambda v: isinstance(v, (int, float))
-            and v is not None
-            and float(v) > 0.0,
+        required=True,
+        severity="error",
+        description="Project life in years; drives CFADS horizon.",
+        validator=_v_positive_int,
+    ),
+    RequiredFieldSpec(
+        module="cashflow",
+        name="capacity_mw",
+        paths=(
+            ("project", "capacity_mw"),
+            ("project", "capacity"),
+            ("parameters", "capacity_mw"),
+            ("parameters", "capacity"),
         ),
-        RequiredFieldSpec(
-            module="cashflow",
-            name="capacity_factor",
-            paths=(
-                ("project", "capacity_factor_pct"),
-                ("project", "capacity_factor"),
-                ("parameters", "capacity_factor_pct"),
-                ("parameters", "capacity_factor"),
-                ("capacity_factor_pct",),
-                ("capacity_factor",),
-            ),
-            required=True,
-            severity="error",
-            description="Net capacity factor (percent or decimal).",
-            validator=lambda v: isinstance(v, (int, float))
-            and v is not None
-            and 0.0 < float(v) <= 100.0,
+        required=True,
+        severity="error",
+        description="Net installed capacity in MW.",
+        validator=_v_positive_number,
+    ),
+    RequiredFieldSpec(
+        module="cashflow",
+        name="capacity_factor",
+        paths=(
+            ("project", "capacity_factor_pct"),
+            ("project", "capacity_factor"),
+            ("parameters", "capacity_factor_pct"),
+            ("parameters", "capacity_factor"),
+            ("capacity_factor_pct",),
+            ("capacity_factor",),
         ),
-        RequiredFieldSpec(
-            module="cashflow",
-            name="tariff_lkr_per_kwh",
-            paths=(
-                ("tariff", "lkr_per_kwh"),
-                ("tariff", "lkr_kwh"),
-                ("tariff", "tariff_lkr_per_kwh"),
-                ("revenue", "tariff_lkr_per_kwh"),
-                ("parameters", "tariff_lkr_per_kwh"),
-                ("parameters", "tariff_lkr"),
-                ("tariff_lkr_per_kwh",),
-                ("tariff_lkr",),
-                ("tariff",),
-            ),
-            required=True,
-            severity="error",
-            description="Front-of-meter tariff in LKR per kWh.",
-            validator=lambda v: isinstance(v, (int, float))
-            and v is not None
-            and float(v) > 0.0,
+        required=True,
+        severity="error",
+        description="Net capacity factor (percent or decimal).",
+        validator=_v_pct_positive,
+    ),
+    RequiredFieldSpec(
+        module="cashflow",
+        name="tariff_lkr_per_kwh",
+        paths=(
+            ("tariff", "lkr_per_kwh"),
+            ("tariff", "lkr_kwh"),
+            ("tariff", "tariff_lkr_per_kwh"),
+            ("revenue", "tariff_lkr_per_kwh"),
+            ("parameters", "tariff_lkr_per_kwh"),
+            ("parameters", "tariff_lkr"),
+            ("tariff_lkr_per_kwh",),
+            ("tariff_lkr",),
+            ("tariff",),
         ),
-        RequiredFieldSpec(
-            module="cashflow",
-            name="opex_usd_per_year",
-            paths=(
-                ("opex", "usd_per_year"),
-                ("opex", "usd_annual"),
-                ("opex", "annual_opex_usd"),
-                ("costs", "opex_usd_per_year"),
-                ("parameters", "opex_usd_per_year"),
-                ("opex_usd_per_year",),
-            ),
-            required=True,
-            severity="error",
-            description="Steady-state operating expenditure in USD per year.",
-            validator=lambda v: isinstance(v, (int, float))
-            and v is not None
-            and float(v) >= 0.0,
+        required=True,
+        severity="error",
+        description="Front-of-meter tariff in LKR per kWh.",
+        validator=_v_positive_number,
+    ),
+    RequiredFieldSpec(
+        module="cashflow",
+        name="opex_usd_per_year",
+        paths=(
+            ("opex", "usd_per_year"),
+            ("opex", "usd_annual"),
+            ("opex", "annual_opex_usd"),
+            ("costs", "opex_usd_per_year"),
+            ("parameters", "opex_usd_per_year"),
+            ("opex_usd_per_year",),
         ),
-        RequiredFieldSpec(
-            module="cashflow",
-            name="corporate_tax_rate",
-            paths=(
-                ("tax", "corporate_tax_rate_pct"),
-                ("tax", "corporate_tax_rate"),
-                ("project", "corporate_tax_rate_pct"),
-                ("project", "corporate_tax_rate"),
-                ("parameters", "corporate_tax_rate_pct"),
-                ("parameters", "corporate_tax_rate"),
-                ("corporate_tax_rate_pct",),
-                ("corporate_tax_rate",),
-            ),
-            required=True,
-            severity="error",
-            description="Headline corporate income tax rate for the project company.",
-            validator=lambda v: isinstance(v, (int, float))
-            and v is not None
-            and 0.0 <= float(v) <= 100.0,
+        required=True,
+        severity="error",
+        description="Steady-state operating expenditure in USD per year.",
+        validator=_v_non_negative_number,
+    ),
+    RequiredFieldSpec(
+        module="cashflow",
+        name="corporate_tax_rate",
+        paths=(
+            ("tax", "corporate_tax_rate_pct"),
+            ("tax", "corporate_tax_rate"),
+            ("project", "corporate_tax_rate_pct"),
+            ("project", "corporate_tax_rate"),
+            ("parameters", "corporate_tax_rate_pct"),
+            ("parameters", "corporate_tax_rate"),
+            ("corporate_tax_rate_pct",),
+            ("corporate_tax_rate",),
         ),
-    ]
+        required=True,
+        severity="error",
+        description="Headline corporate income tax rate for the project company.",
+        validator=_v_pct,
+    ),
+)
+
+_SCHEMA_REGISTERED = False
 
-    register_required_fields("cashflow", specs)
+
+def _register_cashflow_schema() -> None:
+    """
+    Register the core v14 cashflow-required fields with the global schema
+    registry. Mirrors the checks in _extract_parameters.
+
+    Idempotent: the spec tuple is built once at import and only registered
+    on the first call.
+    """
+    global _SCHEMA_REGISTERED
+    if _SCHEMA_REGISTERED:
+        return
+    register_required_fields("cashflow", _CASHFLOW_SPECS)
+    _SCHEMA_REGISTERED = True
 
 
-try:  # pragma: no cover
-    _register_cashflow_schema()
-except Exception:
-    # Never allow schema registration to break the core finance engine
-    pass
+# Register at import time so the schema guard sees us. analytics.config_schema
+# is a hard import above, and registration adds or replaces the prebuilt
+# _CASHFLOW_SPECS by field name, so there is nothing here that needs swallowing.
+_register_cashflow_schema()
 
     
\ No newline at end of file
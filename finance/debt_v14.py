@@ -22,12 +22,23 @@ Version: 3.0 (V14 construction period support)
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Sequence
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Sequence
+
+import numpy as np
 
 from finance.utils import as_float, get_nested
 
+# Optional JIT for the sculpted amortisation recurrence.
+try:  # pragma: no cover - env dependent
+    import numba  # type: ignore
+except Exception:  # pragma: no cover
+    numba = None  # type: ignore
+
 logger = logging.getLogger("dutchbay.v14chat.finance.debt")
 
+# Per-tranche schedule as parallel arrays: (interest, principal, total_service)
+Schedule = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -49,9 +60,43 @@ def _as_float(v: Any, default: Optional[float] = None) -> float:
 
 def _pmt(rate: float, nper: int, pv: float) -> float:
     """Calculate annuity payment (Excel PMT equivalent)."""
+    if nper <= 0:
+        return 0.0
     if rate == 0:
-        return pv / nper if nper > 0 else 0.0
-    return pv * (rate * (1 + rate) ** nper) / ((1 + rate) ** nper - 1)
+        return pv / nper
+    f = (1.0 + rate) ** nper
+    return pv * (rate * f) / (f - 1.0)
+
+
+class FinancingTerms(NamedTuple):
+    """Financing_Terms fields read by apply_debt_layer, with engine defaults."""
+
+    construction_periods: int
+    construction_schedule: List[float]
+    drawdown_pct: List[float]
+    grace_years: int
+    debt_ratio: float
+    tenor: int
+    years_io: int
+    amortization: str
+    target_dscr: float
+
+
+def _extract_financing_terms(p: Dict[str, Any]) -> FinancingTerms:
+    """Read every financing parameter from the Financing_Terms block in one place."""
+    get = p.get
+    return FinancingTerms(
+        construction_periods=int(_as_float(get("construction_periods"), 2)),
+        construction_schedule=get("construction_schedule", [40.0, 60.0]),
+        drawdown_pct=get("debt_drawdown_pct", [0.5, 0.5]),
+        grace_years=int(_as_float(get("grace_years"), 0)),
+        debt_ratio=_as_float(get("debt_ratio"), 0.70),
+        tenor=int(_as_float(get("tenor_years"), 15)),
+        years_io=int(_as_float(get("interest_only_years"), 0)),
+        amortization=(get("amortization_style", "sculpted") or "sculpted").lower(),
+        target_dscr=_as_float(get("target_dscr"), 1.30),
+    )
+
 
 # ============================================================================
 # NEW V14: CONSTRUCTION PERIOD FUNCTIONS
@@ -80,24 +125,20 @@ def calculate_construction_drawdowns(
     list[float]
         Drawn amount per construction period.
     """
-    drawn_schedule: List[float] = []
-    cumulative_drawn = 0.0
-
-    for year_idx, _capex in enumerate(construction_schedule):
-        if year_idx < len(drawdown_pct_per_year):
-            drawn_this_year = total_debt * float(drawdown_pct_per_year[year_idx])
-        else:
-            drawn_this_year = 0.0
-
-        drawn_schedule.append(drawn_this_year)
-        cumulative_drawn += drawn_this_year
+    n = len(construction_schedule)
+    pct = np.zeros(n)
+    m = min(n, len(drawdown_pct_per_year))
+    if m:
+        pct[:m] = np.asarray(drawdown_pct_per_year[:m], dtype=np.float64)
+    drawn = total_debt * pct
+    cumulative_drawn = float(drawn.sum())
 
     if cumulative_drawn > total_debt:
         logger.warning(
             "Total drawn %.2f exceeds total debt %.2f", cumulative_drawn, total_debt
         )
 
-    return drawn_schedule
+    return drawn.tolist()
 
 
 def calculate_idc(
@@ -121,20 +162,30 @@ def calculate_idc(
     -------
     (idc_schedule, total_idc_capitalized)
     """
-    idc_schedule: List[float] = []
+    drawn = np.asarray(debt_drawn_schedule, dtype=np.float64)
+    n = len(drawn)
+    k = min(max(construction_periods, 0), n)
+    idc = np.empty(n)
     outstanding_balance = 0.0
     total_idc_capitalized = 0.0
 
-    for period in range(len(debt_drawn_schedule)):
-        outstanding_balance += debt_drawn_schedule[period]
+    # Capitalising periods: interest compounds into the balance, so this
+    # prefix is an inherently sequential recurrence.
+    for period in range(k):
+        outstanding_balance += drawn[period]
         idc_this_period = outstanding_balance * interest_rate
-        idc_schedule.append(idc_this_period)
+        idc[period] = idc_this_period
+        total_idc_capitalized += idc_this_period
+        outstanding_balance += idc_this_period
 
-        if period < construction_periods:
-            total_idc_capitalized += idc_this_period
-            outstanding_balance += idc_this_period
+    # Later periods only accrue draws; cumsum keeps the loop's summation order.
+    if k < n:
+        tail = drawn[k:].copy()
+        tail[0] += outstanding_balance
+        idc[k:] = np.cumsum(tail) * interest_rate
 
-    return idc_schedule, total_idc_capitalized
+    idc_schedule = idc.tolist()
+    return idc_schedule, float(total_idc_capitalized)
 
 
 # ============================================================================
@@ -154,8 +205,67 @@ class Tranche:
         self.years_io = int(years_io)
 
 
-def _solve_mix(p: Dict[str, Any], debt_total: float) -> Dict[str, Tranche]:
-    """Solve tranche mix based on YAML constraints (v13 logic preserved)."""
+class TrancheSet:
+    """
+    The tranche mix as parallel arrays (struct-of-arrays).
+
+    Position i of rates / principals belongs to names[i]; all tranches share
+    the same interest-only period.
+    """
+
+    __slots__ = ("names", "rates", "principals", "years_io")
+
+    def __init__(
+        self,
+        names: Tuple[str, ...],
+        rates: np.ndarray,
+        principals: np.ndarray,
+        years_io: int,
+    ) -> None:
+        self.names = tuple(names)
+        self.rates = np.asarray(rates, dtype=np.float64)
+        self.principals = np.asarray(principals, dtype=np.float64)
+        self.years_io = int(years_io)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def tranche(self, i: int) -> Tranche:
+        """Scalar view of tranche i (a snapshot, not linked to the arrays)."""
+        return Tranche(
+            self.names[i], float(self.rates[i]), float(self.principals[i]), self.years_io
+        )
+
+
+# Rate keys per tranche, in fallback order (nominal first, then the floor)
+_RATE_KEYS: Dict[str, Tuple[str, ...]] = {
+    "LKR": ("lkr_nominal", "lkr_min"),
+    "USD": ("usd_nominal", "usd_commercial_min"),
+    "DFI": ("dfi_nominal", "dfi_min"),
+}
+
+
+def _first_present(d: Dict[str, Any], keys: Sequence[str], default: Any = 0.0) -> Any:
+    """
+    Value of the first key in `keys` that is set in `d` (not None or "").
+
+    Unlike an `or` chain, a legitimate 0 / 0.0 is returned, not skipped.
+    """
+    for k in keys:
+        v = d.get(k)
+        if v is not None and v != "":
+            return v
+    return default
+
+
+def _solve_mix(
+    p: Dict[str, Any], debt_total: float, years_io: Optional[int] = None
+) -> TrancheSet:
+    """
+    Solve tranche mix based on YAML constraints (v13 logic preserved).
+
+    `years_io` is the shared interest-only period; read from `p` when omitted.
+    """
     mix = p.get("mix", {})
     rates = p.get("rates", {})
 
@@ -163,9 +273,9 @@ def _solve_mix(p: Dict[str, Any], debt_total: float) -> Dict[str, Tranche]:
     mix_dfi_max = _as_float(mix.get("dfi_max"), 0.0)
     mix_usd_min = _as_float(mix.get("usd_commercial_min"), 0.0)
 
-    r_lkr = _as_float(rates.get("lkr_nominal") or rates.get("lkr_min"), 0.0)
-    r_usd = _as_float(rates.get("usd_nominal") or rates.get("usd_commercial_min"), 0.0)
-    r_dfi = _as_float(rates.get("dfi_nominal") or rates.get("dfi_min"), 0.0)
+    r_lkr = _as_float(_first_present(rates, _RATE_KEYS["LKR"]), 0.0)
+    r_usd = _as_float(_first_present(rates, _RATE_KEYS["USD"]), 0.0)
+    r_dfi = _as_float(_first_present(rates, _RATE_KEYS["DFI"]), 0.0)
 
     # Base allocation
     lkr_amt = min(debt_total * mix_lkr_max, debt_total)
@@ -187,13 +297,15 @@ def _solve_mix(p: Dict[str, Any], debt_total: float) -> Dict[str, Tranche]:
 
         usd_amt = max(0.0, debt_total - lkr_amt - dfi_amt)
 
-    years_io = int(_as_float(p.get("interest_only_years"), 0) or 0)
+    if years_io is None:
+        years_io = int(_as_float(p.get("interest_only_years"), 0) or 0)
 
-    return {
-        "LKR": Tranche("LKR", r_lkr, lkr_amt, years_io),
-        "USD": Tranche("USD", r_usd, usd_amt, years_io),
-        "DFI": Tranche("DFI", r_dfi, dfi_amt, years_io),
-    }
+    return TrancheSet(
+        ("LKR", "USD", "DFI"),
+        np.array([r_lkr, r_usd, r_dfi]),
+        np.array([lkr_amt, usd_amt, dfi_amt]),
+        years_io,
+    )
 
 
 # ============================================================================
@@ -201,59 +313,138 @@ def _solve_mix(p: Dict[str, Any], debt_total: float) -> Dict[str, Tranche]:
 # ============================================================================
 
 
-def _annuity_schedule(tr: Tranche, amort_years: int) -> List[Tuple[float, float, float]]:
+def _annuity_schedule(tr: Tranche, amort_years: int, pad_front: int = 0) -> Schedule:
     """
     Build annuity schedule.
 
-    Returns rows as (interest, principal, total_service).
+    Returns parallel arrays (interest, principal, total_service), preceded by
+    `pad_front` zero periods (construction).
     """
-    n = amort_years
+    n = max(amort_years, 0)
+    io = max(tr.years_io, 0)
     bal = tr.principal
-    rows: List[Tuple[float, float, float]] = []
+    interest = np.zeros(pad_front + io + n)
+    principal = np.zeros(pad_front + io + n)
+    start = pad_front + io
 
     # Interest-only period
-    for _ in range(tr.years_io):
-        interest = bal * tr.rate
-        rows.append((interest, 0.0, interest))
+    interest[pad_front:start] = bal * tr.rate
 
-    # Amortization period
+    # Amortization period (closed form): the principal portion of a level
+    # payment grows geometrically, (pmt - bal * r) * (1 + r) ** k.
     if n > 0:
         pmt = _pmt(tr.rate, n, bal)
-        for _ in range(n):
-            interest = bal * tr.rate
-            principal = max(0.0, pmt - interest)
-            bal = max(0.0, bal - principal)
-            rows.append((interest, principal, interest + principal))
+        growth = (1.0 + tr.rate) ** np.arange(n)
+        amort = np.maximum(0.0, (pmt - bal * tr.rate) * growth)
+        opening = np.empty(n)
+        opening[0] = bal
+        opening[1:] = bal - np.cumsum(amort[:-1])
+        interest[start:] = np.maximum(0.0, opening) * tr.rate
+        principal[start:] = amort
+
+    return interest, principal, interest + principal
+
+
+def _sculpted_kernel_py(
+    rates: np.ndarray,
+    principals: np.ndarray,
+    cfads: np.ndarray,
+    io_years: int,
+    amort_years: int,
+    dscr_target: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Scalar-loop sculpting recurrence mirroring _sculpted_schedule.
 
-    return rows
+    Written against plain floats/arrays so it can be compiled with Numba.
+    Returns (interest, principal) matrices of shape (tranche, period).
+    """
+    n_tranches = rates.shape[0]
+    n_periods = io_years + max(amort_years, 0)
+    interest = np.zeros((n_tranches, n_periods))
+    principal = np.zeros((n_tranches, n_periods))
+    obals = principals.copy()
+    n_cf = cfads.shape[0]
+
+    for k in range(n_tranches):
+        for y in range(io_years):
+            interest[k, y] = obals[k] * rates[k]
+
+    for y in range(io_years, n_periods):
+        if n_cf > 0:
+            cf = cfads[y] if y < n_cf else cfads[n_cf - 1]
+        else:
+            cf = 0.0
+        target_service = max(0.0, cf / dscr_target) if dscr_target > 0 else 0.0
+
+        total_interest = 0.0
+        total_bal = 0.0
+        for k in range(n_tranches):
+            interest[k, y] = obals[k] * rates[k]
+            total_interest += interest[k, y]
+            total_bal += obals[k]
+        if total_bal == 0.0:
+            total_bal = 1.0
+        principal_total = max(0.0, target_service - total_interest)
+
+        for k in range(n_tranches):
+            if total_bal > 0:
+                principal_k = min(obals[k], principal_total * (obals[k] / total_bal))
+            else:
+                principal_k = 0.0
+            principal[k, y] = principal_k
+            obals[k] = max(0.0, obals[k] - principal_k)
+
+    return interest, principal
+
+
+if numba is not None:  # pragma: no cover - env dependent
+    _sculpted_kernel = numba.njit(
+        "Tuple((f8[:, :], f8[:, :]))(f8[:], f8[:], f8[:], i8, i8, f8)",
+        cache=True,
+    )(_sculpted_kernel_py)
+else:
+    _sculpted_kernel = None
 
 
 def _sculpted_schedule(
-    tranches: Dict[str, Tranche],
+    tranches: TrancheSet,
     amort_years: int,
     cfads: List[float],
     dscr_target: float,
-) -> Dict[str, List[Tuple[float, float, float]]]:
+    pad_front: int = 0,
+) -> Dict[str, Schedule]:
     """
     Build sculpted schedule targeting DSCR.
 
-    Returns mapping: tranche_name -> list of (interest, principal, total_service).
+    Returns mapping: tranche_name -> parallel arrays (interest, principal, total_service),
+    each preceded by `pad_front` zero periods (construction).
+    Runs the JIT kernel when Numba is importable.
     """
-    obals = {k: tr.principal for k, tr in tranches.items()}
-    schedules: Dict[str, List[Tuple[float, float, float]]] = {k: [] for k in tranches}
-    io_years = max(tr.years_io for tr in tranches.values())
-    year_index = 0
+    if _sculpted_kernel is not None:
+        interest_arr, principal_arr = _sculpted_kernel(
+            tranches.rates,
+            tranches.principals,
+            np.asarray(cfads, dtype=np.float64),
+            tranches.years_io,
+            int(amort_years),
+            float(dscr_target),
+        )
+        return _schedules_by_name(tranches, interest_arr, principal_arr, pad_front)
+
+    rates = tranches.rates
+    obals = tranches.principals.copy()
+    io_years = tranches.years_io
+    n_periods = io_years + max(amort_years, 0)
+    # (tranche, period) matrices
+    interest_arr = np.zeros((len(tranches), n_periods))
+    principal_arr = np.zeros((len(tranches), n_periods))
 
     # Interest-only period
-    for _ in range(io_years):
-        for k, tr in tranches.items():
-            bal = obals[k]
-            interest = bal * tr.rate
-            schedules[k].append((interest, 0.0, interest))
-        year_index += 1
+    interest_arr[:, :io_years] = (obals * rates)[:, None]
 
     # Amortization period
-    for _ in range(amort_years):
+    for year_index in range(io_years, n_periods):
         if cfads:
             cf = cfads[year_index] if year_index < len(cfads) else cfads[-1]
         else:
@@ -261,22 +452,50 @@ def _sculpted_schedule(
 
         target_service = max(0.0, cf / dscr_target) if dscr_target > 0 else 0.0
 
-        interest_map = {k: obals[k] * tranches[k].rate for k in tranches}
-        total_interest = sum(interest_map.values())
+        interest_vec = obals * rates
+        total_interest = float(interest_vec.sum())
         principal_total = max(0.0, target_service - total_interest)
 
-        total_bal = sum(obals.values()) or 1.0
-        for k, tr in tranches.items():
-            bal = obals[k]
-            prorata = bal / total_bal if total_bal > 0 else 0.0
-            principal_k = min(bal, principal_total * prorata)
-            interest_k = interest_map[k]
-            obals[k] = max(0.0, bal - principal_k)
-            schedules[k].append((interest_k, principal_k, interest_k + principal_k))
+        total_bal = float(obals.sum()) or 1.0
+        if total_bal > 0:
+            principal_vec = np.minimum(obals, principal_total * (obals / total_bal))
+        else:
+            principal_vec = np.zeros(len(tranches))
+        obals = np.maximum(0.0, obals - principal_vec)
+        interest_arr[:, year_index] = interest_vec
+        principal_arr[:, year_index] = principal_vec
+
+    return _schedules_by_name(tranches, interest_arr, principal_arr, pad_front)
+
+
+def _schedules_by_name(
+    tranches: TrancheSet,
+    interest_arr: np.ndarray,
+    principal_arr: np.ndarray,
+    pad_front: int = 0,
+) -> Dict[str, Schedule]:
+    """Split (tranche, period) matrices into per-tranche Schedule tuples."""
+    if pad_front > 0:
+        n_tranches, n_periods = interest_arr.shape
+        padded_interest = np.zeros((n_tranches, pad_front + n_periods))
+        padded_principal = np.zeros((n_tranches, pad_front + n_periods))
+        padded_interest[:, pad_front:] = interest_arr
+        padded_principal[:, pad_front:] = principal_arr
+        interest_arr, principal_arr = padded_interest, padded_principal
+    return {
+        k: (interest_arr[i], principal_arr[i], interest_arr[i] + principal_arr[i])
+        for i, k in enumerate(tranches.names)
+    }
 
-        year_index += 1
 
-    return schedules
+def _schedule_rows(
+    schedules: Dict[str, Schedule],
+) -> Dict[str, List[Tuple[float, float, float]]]:
+    """Public debt_schedules layout: per-period (interest, principal, total_service) rows."""
+    return {
+        k: list(zip(interest.tolist(), principal.tolist(), service.tolist()))
+        for k, (interest, principal, service) in schedules.items()
+    }
 
 
 # ============================================================================
@@ -304,86 +523,84 @@ def apply_debt_layer(params: Dict[str, Any], annual_rows: List[Dict[str, Any]])
     # Extract financing params
     p = params.get("Financing_Terms", params.get("financing", params))
 
-    # ---------- CONSTRUCTION PARAMETERS ----------
-    construction_periods = int(_as_float(p.get("construction_periods"), 2))
-    construction_schedule = p.get("construction_schedule", [40.0, 60.0])
-    drawdown_pct = p.get("debt_drawdown_pct", [0.5, 0.5])
-    grace_years = int(_as_float(p.get("grace_years"), 0))
-
-    # ---------- STANDARD PARAMETERS ----------
-    debt_ratio = _as_float(p.get("debt_ratio"), 0.70)
-    tenor = int(_as_float(p.get("tenor_years"), 15))
-    years_io = int(_as_float(p.get("interest_only_years"), 0))
-    amortization = (p.get("amortization_style", "sculpted") or "sculpted").lower()
-    target_dscr = _as_float(p.get("target_dscr"), 1.30)
+    # ---------- CONSTRUCTION + STANDARD PARAMETERS ----------
+    (
+        construction_periods,
+        construction_schedule,
+        drawdown_pct,
+        grace_years,
+        debt_ratio,
+        tenor,
+        years_io,
+        amortization,
+        target_dscr,
+    ) = _extract_financing_terms(p)
 
     capex = float(params.get("capex", {}).get("usd_total", 100.0))
     debt_total = capex * debt_ratio
 
-    logger.info(
-        "V14 Debt Planning: %d-year construction, %d-year tenor",
-        construction_periods,
-        tenor,
-    )
+    log_info = logger.isEnabledFor(logging.INFO)
+    if log_info:
+        logger.info(
+            "V14 Debt Planning: %d-year construction, %d-year tenor",
+            construction_periods,
+            tenor,
+        )
 
     # ---------- TRANCHE MIX + IDC ----------
-    tranches = _solve_mix(p, debt_total)
+    tranches = _solve_mix(p, debt_total, years_io)
 
     idc_schedule: Dict[str, List[float]] = {}
     total_idc_by_tranche: Dict[str, float] = {}
 
-    for tranche_name, tranche in tranches.items():
+    for i, tranche_name in enumerate(tranches.names):
         drawn = calculate_construction_drawdowns(
-            tranche.principal,
+            float(tranches.principals[i]),
             construction_schedule,
             drawdown_pct,
         )
 
         idc_per_period, total_idc_cap = calculate_idc(
             drawn,
-            tranche.rate,
+            float(tranches.rates[i]),
             construction_periods,
         )
 
         idc_schedule[tranche_name] = idc_per_period
         total_idc_by_tranche[tranche_name] = total_idc_cap
 
-        tranche.principal += total_idc_cap
-        logger.info(
-            "  %s: Principal $%.2fM (IDC: $%.2fM)",
-            tranche_name,
-            tranche.principal,
-            total_idc_cap,
-        )
+        tranches.principals[i] += total_idc_cap
+        if log_info:
+            logger.info(
+                "  %s: Principal $%.2fM (IDC: $%.2fM)",
+                tranche_name,
+                tranches.principals[i],
+                total_idc_cap,
+            )
 
-    principal_after_idc = {name: tr.principal for name, tr in tranches.items()}
+    principal_after_idc = dict(zip(tranches.names, tranches.principals.tolist()))
 
     # ---------- EXTEND CFADS TO 23 PERIODS ----------
     cfads = [a.get("cfads_usd", 0.0) for a in annual_rows]
 
-    cfads_extended: List[float] = []
-    # Construction periods: 0 CFADS
-    for _ in range(construction_periods):
-        cfads_extended.append(0.0)
-
-    # Transition period: partial CFADS (50%)
-    if cfads:
-        cfads_extended.append(cfads[0] * 0.5)
-    else:
-        cfads_extended.append(0.0)
-
-    # Operational periods: full CFADS
-    cfads_extended.extend(cfads)
-
-    # Ensure exactly 23 periods
-    while len(cfads_extended) < 23:
-        cfads_extended.append(cfads[-1] if cfads else 0.0)
-    cfads_extended = cfads_extended[:23]
-
-    # ---------- BUILD SCHEDULES ----------
+    # Construction periods: 0 CFADS; transition period: partial CFADS (50%);
+    # then full operational CFADS, padded with the last year to 23 periods.
+    n_timeline = 23
+    cfads_np = np.zeros(n_timeline)
+    first_op = max(construction_periods, 0)
+    if cfads and first_op < n_timeline:
+        cfads_np[first_op] = cfads[0] * 0.5
+        ops = cfads[: n_timeline - first_op - 1]
+        tail = first_op + 1 + len(ops)
+        cfads_np[first_op + 1 : tail] = ops
+        cfads_np[tail:] = cfads[-1]
+    cfads_extended: List[float] = cfads_np.tolist()
+
+    # ---------- BUILD SCHEDULES (front-padded with construction zeros) ----------
     if amortization in ("annuity", "fixed"):
-        schedules: Dict[str, List[Tuple[float, float, float]]] = {
-            k: _annuity_schedule(tr, tenor - tr.years_io) for k, tr in tranches.items()
+        schedules: Dict[str, Schedule] = {
+            k: _annuity_schedule(tranches.tranche(i), tenor - years_io, first_op)
+            for i, k in enumerate(tranches.names)
         }
     else:
         schedules = _sculpted_schedule(
@@ -391,60 +608,48 @@ def apply_debt_layer(params: Dict[str, Any], annual_rows: List[Dict[str, Any]])
             tenor - years_io,
             cfads_extended[construction_periods:],
             target_dscr,
+            first_op,
         )
 
-    # Pad schedules with construction-period zeros
-    for k in schedules:
-        padded = [(0.0, 0.0, 0.0)] * construction_periods + schedules[k]
-        schedules[k] = padded
-
     # ---------- COMPUTE METRICS OVER 23 PERIODS ----------
-    dscr_series: List[float] = []
-    debt_service_total: List[float] = []
-    debt_outstanding: List[float] = []
-
-    outstanding_balances = {k: tr.principal for k, tr in tranches.items()}
-
-    for period in range(23):
-        total_outstanding = sum(outstanding_balances.values())
-        debt_outstanding.append(total_outstanding)
-
-        total_service = 0.0
-        for k in schedules:
-            if period < len(schedules[k]):
-                interest, principal, service = schedules[k][period]
-                total_service += service
-                outstanding_balances[k] = max(
-                    0.0, outstanding_balances[k] - principal
-                )
-
-        debt_service_total.append(total_service)
-
-        if period < len(cfads_extended):
-            cfads_this_period = cfads_extended[period]
-        else:
-            cfads_this_period = 0.0
-
-        if period >= construction_periods and total_service > 0:
-            dscr = cfads_this_period / total_service
-        else:
-            dscr = float("inf")
-
-        dscr_series.append(dscr)
-
-    dscr_operational = [
-        d for i, d in enumerate(dscr_series) if i >= construction_periods and d < float("inf")
-    ]
-    dscr_min = min(dscr_operational) if dscr_operational else 0.0
+    # Dense (tranche, period) matrices; periods past a schedule's end are zero.
+    n_periods = n_timeline
+    principal_start = tranches.principals
+    principal_mat = np.zeros((len(schedules), n_periods))
+    service_mat = np.zeros((len(schedules), n_periods))
+    for row, (_interest, principal, service) in enumerate(schedules.values()):
+        m = min(len(service), n_periods)
+        principal_mat[row, :m] = principal[:m]
+        service_mat[row, :m] = service[:m]
+
+    # Balance of each tranche after each period's repayment (never below zero)
+    closing = np.maximum(0.0, principal_start[:, None] - np.cumsum(principal_mat, axis=1))
+    outstanding = np.empty(n_periods)
+    outstanding[0] = principal_start.sum()
+    outstanding[1:] = closing[:, :-1].sum(axis=0)
+    services = service_mat.sum(axis=0)
+
+    operational = (np.arange(n_periods) >= construction_periods) & (services > 0)
+    safe_services = np.where(operational, services, 1.0)
+    dscr_np = np.where(operational, cfads_np / safe_services, np.inf)
+
+    dscr_series: List[float] = dscr_np.tolist()
+    debt_service_total: List[float] = services.tolist()
+    debt_outstanding: List[float] = outstanding.tolist()
+    outstanding_balances = dict(zip(tranches.names, closing[:, -1].tolist()))
+
+    dscr_operational = dscr_np[operational & (dscr_np < np.inf)]
+    dscr_min = float(dscr_operational.min()) if dscr_operational.size else 0.0
 
     balloon_remaining = sum(outstanding_balances.values())
     total_idc_capitalized = sum(total_idc_by_tranche.values())
 
-    logger.info(
-        "V14 Results: Min DSCR=%.2f, Total IDC=$%.2fM",
-        dscr_min,
-        total_idc_capitalized,
-    )
+    if log_info:
+        logger.info(
+            "V14 Results: Min DSCR=%.2f, Total IDC=$%.2fM",
+            dscr_min,
+            total_idc_capitalized,
+        )
 
     audit_status = "PASS" if dscr_min >= 1.30 else "REVIEW"
 
@@ -466,7 +671,7 @@ def apply_debt_layer(params: Dict[str, Any], annual_rows: List[Dict[str, Any]])
         "timeline_periods": 23,
         "tenor_years": tenor,
         "cfads_extended": cfads_extended,
-        "debt_schedules": schedules,
+        "debt_schedules": _schedule_rows(schedules),
         # Validation / diagnostics
         "validation_warnings": [],
         "dscr_violations": [],
@@ -515,21 +720,16 @@ def plan_debt(
         k: float(v) for k, v in (core.get("idc_by_tranche", {}) or {}).items()
     }
 
-    def _p(tranche: str) -> float:
-        return float(principal_by_tranche.get(tranche, 0.0))
-
-    def _i(tranche: str) -> float:
-        return float(idc_by_tranche.get(tranche, 0.0))
-
-    lkr_principal = _p("LKR")
-    usd_principal = _p("USD")
-    dfi_principal = _p("DFI")
-
-    lkr_idc = _i("LKR")
-    usd_idc = _i("USD")
-    dfi_idc = _i("DFI")
+    # Canonical per-tranche figures, keyed by lower-case tranche name
+    tranche_figures: Dict[str, Tuple[float, float]] = {
+        name.lower(): (
+            float(principal_by_tranche.get(name, 0.0)),
+            float(idc_by_tranche.get(name, 0.0)),
+        )
+        for name in ("LKR", "USD", "DFI")
+    }
 
-    total_idc = lkr_idc + usd_idc + dfi_idc
+    total_idc = sum(idc for _principal, idc in tranche_figures.values())
     if "total_idc_capitalized" in core:
         total_idc = float(core.get("total_idc_capitalized", total_idc))
 
@@ -541,47 +741,39 @@ def plan_debt(
         "construction_years": construction_years,
         "tenor_years": tenor_years,
         "timeline_periods": timeline_periods,
-        # Nested tranche summaries (what _extract_tranche(...) expects)
-        "lkr": {
-            "principal": lkr_principal,
-            "principal_m": lkr_principal,
-            "idc": lkr_idc,
-            "idc_m": lkr_idc,
-        },
-        "usd": {
-            "principal": usd_principal,
-            "principal_m": usd_principal,
-            "idc": usd_idc,
-            "idc_m": usd_idc,
-        },
-        "dfi": {
-            "principal": dfi_principal,
-            "principal_m": dfi_principal,
-            "idc": dfi_idc,
-            "idc_m": dfi_idc,
-        },
-        "total_idc": total_idc,
-        "min_dscr": min_dscr,
-        # Compatibility / richer fields
-        "construction_periods": core.get("construction_periods"),
-        "grace_periods": core.get("grace_periods"),
-        "construction_schedule": core.get("construction_schedule"),
-        "principal_by_tranche": principal_by_tranche,
-        "idc_by_tranche": idc_by_tranche,
-        "cfads_extended": core.get("cfads_extended"),
-        "debt_schedules": core.get("debt_schedules"),
-        "debt_outstanding": core.get("debt_outstanding"),
-        "debt_service_total": core.get("debt_service_total"),
-        "balloon_remaining": core.get("balloon_remaining"),
-        "audit_status": core.get("audit_status", "REVIEW"),
-        # Extra flat fields for analytics / workbook layers
-        "lkr_principal": lkr_principal,
-        "usd_principal": usd_principal,
-        "dfi_principal": dfi_principal,
-        "lkr_idc": lkr_idc,
-        "usd_idc": usd_idc,
-        "dfi_idc": dfi_idc,
-        "total_idc_capitalized": total_idc,
     }
+    # Nested tranche summaries (what _extract_tranche(...) expects); the *_m
+    # keys are legacy aliases of the same values.
+    for key, (principal, idc) in tranche_figures.items():
+        result[key] = {
+            "principal": principal,
+            "principal_m": principal,
+            "idc": idc,
+            "idc_m": idc,
+        }
+    result.update(
+        {
+            "total_idc": total_idc,
+            "min_dscr": min_dscr,
+            # Compatibility / richer fields
+            "construction_periods": core.get("construction_periods"),
+            "grace_periods": core.get("grace_periods"),
+            "construction_schedule": core.get("construction_schedule"),
+            "principal_by_tranche": principal_by_tranche,
+            "idc_by_tranche": idc_by_tranche,
+            "cfads_extended": core.get("cfads_extended"),
+            "debt_schedules": core.get("debt_schedules"),
+            "debt_outstanding": core.get("debt_outstanding"),
+            "debt_service_total": core.get("debt_service_total"),
+            "balloon_remaining": core.get("balloon_remaining"),
+            "audit_status": core.get("audit_status", "REVIEW"),
+        }
+    )
+    # Extra flat fields for analytics / workbook layers
+    for key, (principal, _idc) in tranche_figures.items():
+        result[f"{key}_principal"] = principal
+    for key, (_principal, idc) in tranche_figures.items():
+        result[f"{key}_idc"] = idc
+    result["total_idc_capitalized"] = total_idc
 
     return result
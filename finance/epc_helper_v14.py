@@ -27,10 +27,12 @@ Other callers (existing shims) should import from here, e.g.:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Mapping, Optional
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
 
 from analytics.config_schema import RequiredFieldSpec, register_required_fields
-from finance.utils import as_float, get_nested
+from finance.utils import as_float, nested_getter
 
 
 # ---------------------------------------------------------------------------
@@ -38,6 +40,9 @@ from finance.utils import as_float, get_nested
 # ---------------------------------------------------------------------------
 
 
+_FX_RATE_KEYS = ("base_rate", "rate", "start_lkr_per_usd")
+
+
 def _resolve_fx_rate(
     config: Dict[str, Any],
     default_fx_rate: Optional[float] = None,
@@ -57,25 +62,23 @@ def _resolve_fx_rate(
     """
     fx_block = config.get("fx", {})
 
-    candidates: List[Optional[float]] = []
-
     # v14-style keys under `fx`
     if isinstance(fx_block, dict):
-        for key in ("base_rate", "rate", "start_lkr_per_usd"):
-            if key in fx_block:
-                candidates.append(as_float(fx_block.get(key)))
-
+        for key in _FX_RATE_KEYS:
+            value = as_float(fx_block.get(key))
+            if value is not None and value > 0:
+                return value
     # Historical scalar fx at root (non-mapping)
-    if "fx" in config and not isinstance(fx_block, dict):
-        candidates.append(as_float(config.get("fx")))
+    elif "fx" in config:
+        value = as_float(fx_block)
+        if value is not None and value > 0:
+            return value
 
     # Caller-provided fallback
     if default_fx_rate is not None:
-        candidates.append(float(default_fx_rate))
-
-    for value in candidates:
-        if value is not None and value > 0:
-            return float(value)
+        value = float(default_fx_rate)
+        if value > 0:
+            return value
 
     raise ValueError("Unable to resolve FX rate (LKR per USD) from config or defaults")
 
@@ -90,6 +93,16 @@ def _pct_or_zero(value: Any) -> float:
 
     Returns a float in [0, 1]. None and invalid values become 0.0.
     """
+    # Fast path: validated configs almost always hold a plain float.
+    if type(value) is float:
+        if value > 1.0:
+            return value / 100.0
+        if value < 0.0:
+            return 0.0
+        return value
+    if value is None:
+        return 0.0
+
     raw = as_float(value, default=0.0)
     if raw is None:
         return 0.0
@@ -107,6 +120,12 @@ def _pct_or_zero(value: Any) -> float:
 # ---------------------------------------------------------------------------
 
 
+# Capex lookups bound once rather than walked per call.
+_get_capex_usd_total = nested_getter(("capex", "usd_total"))
+_get_capex_freight_pct = nested_getter(("capex", "freight_pct"))
+_get_capex_contingency_pct = nested_getter(("capex", "contingency_pct"))
+
+
 def epc_breakdown_from_config(
     config: Dict[str, Any],
     default_fx_rate: Optional[float] = None,
@@ -131,15 +150,15 @@ def epc_breakdown_from_config(
     """
     # Base EPC in USD – this is required and should already be enforced
     # by the schema guard, but we defend anyway.
-    base_epc_usd_opt = as_float(get_nested(config, ("capex", "usd_total")))
+    base_epc_usd_opt = as_float(_get_capex_usd_total(config))
     if base_epc_usd_opt is None or base_epc_usd_opt <= 0:
         raise ValueError("capex.usd_total must be a positive number (USD EPC base)")
 
     base_epc_usd = float(base_epc_usd_opt)
 
     # Optional percentages with sane defaults
-    freight_pct = _pct_or_zero(get_nested(config, ("capex", "freight_pct")))
-    contingency_pct = _pct_or_zero(get_nested(config, ("capex", "contingency_pct")))
+    freight_pct = _pct_or_zero(_get_capex_freight_pct(config))
+    contingency_pct = _pct_or_zero(_get_capex_contingency_pct(config))
 
     # Derived USD amounts
     freight_usd = base_epc_usd * freight_pct
@@ -239,56 +258,112 @@ def epc_breakdown_dict(
     }
 
 
+def epc_breakdown_batch(
+    configs: Sequence[Mapping[str, Any]],
+    default_fx_rate: float = 300.0,
+) -> Dict[str, np.ndarray]:
+    """Vectorised epc_breakdown_dict over many configs.
+
+    Returns the same keys as epc_breakdown_dict, each mapped to a float64
+    array with one entry per config (in input order). Inputs are parsed per
+    config exactly as epc_breakdown_dict does; the USD and LCY layers are
+    then computed as (N, 4) array expressions.
+    """
+    n = len(configs)
+    inputs = np.empty((n, 4), dtype=np.float64)
+    for i, config in enumerate(configs):
+        capex = config.get("capex") or {}
+        fx_cfg = config.get("fx") or {}
+        base_cost_usd_val = capex.get("usd_total")
+        if base_cost_usd_val is None:
+            raise KeyError("capex.usd_total is required for EPC breakdown")
+        inputs[i, 0] = float(base_cost_usd_val)
+        inputs[i, 1] = float(capex.get("freight_pct", 0.0) or 0.0)
+        inputs[i, 2] = float(capex.get("contingency_pct", 0.0) or 0.0)
+        inputs[i, 3] = float(fx_cfg.get("base_rate", default_fx_rate))
+
+    base, freight_pct, contingency_pct, fx_rate = inputs.T
+
+    # USD layer: columns are base, freight, contingency, total
+    usd = np.empty((n, 4), dtype=np.float64)
+    usd[:, 0] = base
+    usd[:, 1] = base * freight_pct
+    usd[:, 2] = base * contingency_pct
+    usd[:, 3] = usd[:, 0] + usd[:, 1] + usd[:, 2]
+
+    # LCY layer in one broadcast multiply
+    lcy = usd * fx_rate[:, None]
+
+    return {
+        "base_cost_usd": usd[:, 0],
+        "freight_pct": freight_pct,
+        "freight_usd": usd[:, 1],
+        "contingency_pct": contingency_pct,
+        "contingency_usd": usd[:, 2],
+        "total_usd": usd[:, 3],
+        "fx_rate": fx_rate,
+        "base_cost_lcy": lcy[:, 0],
+        "freight_lcy": lcy[:, 1],
+        "contingency_lcy": lcy[:, 2],
+        "total_lcy": lcy[:, 3],
+    }
+
+
 # ---------------------------------------------------------------------------
 # Schema registration – hook into the v14 validator
 # ---------------------------------------------------------------------------
 
 
+# EPC fields, registered against the "cashflow" module because EPC is a core
+# cashflow dependency (capex and depreciation ladder), not a separate module.
+_EPC_SPECS: Tuple[RequiredFieldSpec, ...] = (
+    RequiredFieldSpec(
+        module="cashflow",
+        name="epc_usd_total",
+        paths=[
+            ("capex", "usd_total"),
+            ("capex", "epc_usd"),  # backwards-compatible alias
+        ],
+        required=True,
+        severity="error",
+        description="Base EPC / capex total in USD",
+    ),
+    RequiredFieldSpec(
+        module="cashflow",
+        name="epc_freight_pct",
+        paths=[
+            ("capex", "freight_pct"),
+        ],
+        required=False,
+        severity="warning",
+        description="Freight as a percentage of base EPC (0–1 or 0–100)",
+    ),
+    RequiredFieldSpec(
+        module="cashflow",
+        name="epc_contingency_pct",
+        paths=[
+            ("capex", "contingency_pct"),
+        ],
+        required=False,
+        severity="warning",
+        description="Contingency as a percentage of base EPC (0–1 or 0–100)",
+    ),
+)
+
+_EPC_SCHEMA_REGISTERED = False
+
+
 def _register_epc_schema() -> None:
     """
     Register EPC-related fields with the shared config schema so that
     validate_config_for_v14(..., modules=["cashflow"]) can flag missing
-    EPC inputs.
-
-    We register against the "cashflow" module because EPC is a core
-    cashflow dependency (capex and depreciation ladder), not a separate
-    module in its own right.
+    EPC inputs. Idempotent: only the first call registers _EPC_SPECS.
     """
-    specs: List[RequiredFieldSpec] = [
-        RequiredFieldSpec(
-            module="cashflow",
-            name="epc_usd_total",
-            paths=[
-                ("capex", "usd_total"),
-                ("capex", "epc_usd"),  # backwards-compatible alias
-            ],
-            required=True,
-            severity="error",
-            description="Base EPC / capex total in USD",
-        ),
-        RequiredFieldSpec(
-            module="cashflow",
-            name="epc_freight_pct",
-            paths=[
-                ("capex", "freight_pct"),
-            ],
-            required=False,
-            severity="warning",
-            description="Freight as a percentage of base EPC (0–1 or 0–100)",
-        ),
-        RequiredFieldSpec(
-            module="cashflow",
-            name="epc_contingency_pct",
-            paths=[
-                ("capex", "contingency_pct"),
-            ],
-            required=False,
-            severity="warning",
-            description="Contingency as a percentage of base EPC (0–1 or 0–100)",
-        ),
-    ]
-
-    register_required_fields("cashflow", specs)
+    global _EPC_SCHEMA_REGISTERED
+    if _EPC_SCHEMA_REGISTERED:
+        return
+    register_required_fields("cashflow", _EPC_SPECS)
+    _EPC_SCHEMA_REGISTERED = True
 
 
 # Register at import time so the schema guard sees us.
@@ -298,5 +373,6 @@ _register_epc_schema()
 __all__ = [
     "epc_breakdown_from_config",
     "epc_breakdown_dict",
+    "epc_breakdown_batch",
 ]
 
@@ -16,19 +16,26 @@ with the following sign convention:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional, Sequence, Tuple
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Tuple
 
 import math
 
+import numpy as np
+
 from constants import DEFAULT_DISCOUNT_RATE
-from finance.irr import irr as _irr, npv as _npv
-from analytics.contracts_v14 import EquityPerformance, DownsideMetrics
+from finance.irr import irr as _irr, irr_batch as _irr_batch, npv as _npv
+from analytics.contracts_v14 import (
+    DownsideMetrics,
+    EquityPerformance,
+    EquityPerformanceBatch,
+)
 
 
 Number = float  # keep it simple internally
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EquityCashflowSummary:
     """Derived equity cashflow series.
 
@@ -36,7 +43,7 @@ class EquityCashflowSummary:
     makes it easy to unit-test series construction independently.
     """
 
-    cashflows: List[Number]
+    cashflows: np.ndarray
     """Full equity cashflow series (negative = contributions, positive = distributions)."""
 
     total_invested: float
@@ -46,18 +53,44 @@ class EquityCashflowSummary:
     """Total cash returned to equity (sum of positive cashflows)."""
 
 
-def _clean_cashflows(cashflows: Sequence[float]) -> List[Number]:
-    """Coerce an arbitrary numeric sequence into a clean List[float]."""
-    cleaned: List[Number] = []
-    for v in cashflows:
-        try:
-            f = float(v)
-        except (TypeError, ValueError):
-            continue
-        if not math.isfinite(f):
-            continue
-        cleaned.append(f)
-    return cleaned
+def _clean_cashflows(cashflows: Sequence[float]) -> np.ndarray:
+    """Coerce an arbitrary numeric sequence into a clean float64 array.
+
+    Non-numeric and non-finite entries are dropped.
+    """
+    try:
+        arr = np.asarray(cashflows, dtype=np.float64).ravel()
+    except (TypeError, ValueError):
+        # Mixed/non-numeric input: fall back to per-element coercion.
+        values: List[Number] = []
+        for v in cashflows:
+            try:
+                values.append(float(v))
+            except (TypeError, ValueError):
+                continue
+        arr = np.asarray(values, dtype=np.float64)
+    return arr[np.isfinite(arr)]
+
+
+def _distributions_array(values: Sequence[float]) -> np.ndarray:
+    """Distributions as a float64 array; non-numeric entries count as 0.0."""
+    try:
+        arr = np.asarray(values, dtype=np.float64).ravel()
+    except (TypeError, ValueError):
+        arr = None
+    if arr is None or np.isnan(arr).any():
+        # Per-element path: None (which asarray turns into NaN) and strings
+        # become 0.0, while a genuine NaN is kept.
+        arr = np.array([_float_or_zero(v) for v in values], dtype=np.float64)
+    return arr
+
+
+def _float_or_zero(value: Any) -> float:
+    """float(value), or 0.0 if value is not numeric."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
 
 
 def summarise_equity_cashflows(cashflows: Sequence[float]) -> EquityCashflowSummary:
@@ -69,12 +102,12 @@ def summarise_equity_cashflows(cashflows: Sequence[float]) -> EquityCashflowSumm
     to analyse.
     """
     cleaned = _clean_cashflows(cashflows)
-    total_invested = -sum(cf for cf in cleaned if cf < 0.0)
-    cumulative_distributions = sum(cf for cf in cleaned if cf > 0.0)
+    total_invested = -cleaned[cleaned < 0.0].sum()
+    cumulative_distributions = cleaned[cleaned > 0.0].sum()
     return EquityCashflowSummary(
         cashflows=cleaned,
-        total_invested=total_invested,
-        cumulative_distributions=cumulative_distributions,
+        total_invested=float(total_invested),
+        cumulative_distributions=float(cumulative_distributions),
     )
 
 
@@ -84,17 +117,37 @@ def calculate_equity_irr(cashflows: Sequence[float]) -> Optional[float]:
     Returns None if IRR cannot be computed (no sign change, degenerate series, etc.).
     """
     cleaned = _clean_cashflows(cashflows)
-    if not cleaned:
+    if cleaned.size == 0:
         return None
+    return _cached_irr(tuple(cleaned.tolist()))
+
 
+# IRR depends on the series alone, so sweeps that only vary e.g. the
+# discount rate or NAV re-solve the same series; memoise on its values.
+@lru_cache(maxsize=4096)
+def _cached_irr(cashflows: Tuple[float, ...]) -> Optional[float]:
     try:
-        value = _irr(cleaned)
+        value = _irr(cashflows)
     except Exception:
         return None
 
-    if value is None or not math.isfinite(float(value)):
+    if value is None or not math.isfinite(value):
         return None
-    return float(value)
+    return value
+
+
+def calculate_equity_irr_batch(
+    cashflows_2d: Sequence[Sequence[float]],
+) -> List[Optional[float]]:
+    """Equity IRR for each row of a (scenarios, periods) cashflow matrix.
+
+    Intended for Monte Carlo / scenario sweeps where every row shares the same
+    period grid; all rows are solved together. Unlike calculate_equity_irr,
+    rows are not cleaned (dropping a value would shift the periods), so a row
+    containing a non-finite value yields None, as does a row with no IRR.
+    """
+    values = _irr_batch(cashflows_2d)
+    return [float(v) if math.isfinite(v) else None for v in values.tolist()]
 
 
 def calculate_cash_on_cash(
@@ -109,14 +162,7 @@ def calculate_cash_on_cash(
     if total_equity_invested <= 0.0:
         return []
 
-    result: List[float] = []
-    for dist in annual_distributions:
-        try:
-            f = float(dist)
-        except (TypeError, ValueError):
-            f = 0.0
-        result.append(f / total_equity_invested)
-    return result
+    return (_distributions_array(annual_distributions) / total_equity_invested).tolist()
 
 
 def calculate_moic(
@@ -132,7 +178,7 @@ def calculate_moic(
     """
     if total_invested <= 0.0:
         return None
-    return (float(cumulative_distributions) + float(current_nav)) / float(total_invested)
+    return (cumulative_distributions + current_nav) / total_invested
 
 
 def calculate_payback_period(
@@ -148,26 +194,21 @@ def calculate_payback_period(
     if initial_equity <= 0.0:
         return None
 
-    cumulative = 0.0
-    year_index = 0
-    for dist in annual_distributions:
-        year_index += 1
-        try:
-            f = float(dist)
-        except (TypeError, ValueError):
-            f = 0.0
-
-        prev_cumulative = cumulative
-        cumulative += f
+    dists = _distributions_array(annual_distributions)
 
-        if cumulative >= initial_equity and f > 0.0:
-            # Linear interpolation within the year for a smoother payback estimate.
-            shortfall = initial_equity - prev_cumulative
-            fraction = shortfall / f
-            # We reached payback within this year; fraction of the year consumed.
-            return (year_index - 1) + fraction
+    # Payback year: first year whose distribution is positive and takes the
+    # running total to the initial equity. Distributions can be negative, so
+    # the running total is not sorted and searchsorted does not apply.
+    cumulative = np.cumsum(dists)
+    hit = (cumulative >= initial_equity) & (dists > 0.0)
+    if not hit.any():
+        return None
+    idx = int(hit.argmax())
 
-    return None
+    # Linear interpolation within the year for a smoother payback estimate.
+    prev_cumulative = cumulative[idx - 1] if idx > 0 else 0.0
+    fraction = (initial_equity - prev_cumulative) / dists[idx]
+    return idx + float(fraction)
 
 
 def _equity_npv(
@@ -180,7 +221,7 @@ def _equity_npv(
     Returns None if the series is empty.
     """
     cleaned = _clean_cashflows(cashflows)
-    if not cleaned:
+    if cleaned.size == 0:
         return None
 
     rate = float(discount_rate) if discount_rate is not None else DEFAULT_DISCOUNT_RATE
@@ -189,9 +230,9 @@ def _equity_npv(
     except Exception:
         return None
 
-    if value is None or not math.isfinite(float(value)):
+    if value is None or not math.isfinite(value):
         return None
-    return float(value)
+    return value
 
 
 def calculate_pe_triad(
@@ -211,9 +252,8 @@ def calculate_pe_triad(
     if capital_called <= 0.0:
         return (None, None, None)
 
-    called = float(capital_called)
-    dpi = float(cumulative_distributions) / called
-    rvpi = float(current_nav) / called
+    dpi = cumulative_distributions / capital_called
+    rvpi = current_nav / capital_called
     return (dpi, rvpi, dpi + rvpi)
 
 
@@ -234,13 +274,13 @@ def calculate_equity_performance(
         # Nothing invested, nothing to measure.
         return None
 
-    annual_dists: List[float] = [cf for cf in summary.cashflows if cf > 0.0]
+    annual_dists = summary.cashflows[summary.cashflows > 0.0]
 
     equity_irr = calculate_equity_irr(summary.cashflows)
     equity_npv = _equity_npv(summary.cashflows, discount_rate=discount_rate)
 
     annual_coc = calculate_cash_on_cash(annual_dists, summary.total_invested)
-    average_coc: float = float(sum(annual_coc) / len(annual_coc)) if annual_coc else 0.0
+    average_coc: float = sum(annual_coc) / len(annual_coc) if annual_coc else 0.0
     payback_period_years = calculate_payback_period(annual_dists, summary.total_invested)
     moic = calculate_moic(summary.cumulative_distributions, current_nav, summary.total_invested)
 
@@ -263,4 +303,79 @@ def calculate_equity_performance(
         downside=None,
     )
 
-    
\ No newline at end of file
+
+def calculate_equity_performance_batch(
+    cashflows_2d: Sequence[Sequence[float]],
+    *,
+    discount_rate: Optional[float] = None,
+    current_nav: float = 0.0,
+) -> EquityPerformanceBatch:
+    """EquityPerformance for each row of a (scenarios, periods) cashflow matrix.
+
+    Column-wise counterpart of calculate_equity_performance for Monte Carlo
+    and scenario sweeps on a shared period grid. As in
+    calculate_equity_irr_batch, rows are not cleaned: a row with a
+    non-finite value, or with nothing invested, yields NaN throughout.
+    The ragged per-year annual_coc list is not produced.
+    """
+    cfs = np.asarray(cashflows_2d, dtype=np.float64)
+    if cfs.ndim != 2:
+        raise ValueError("cashflows_2d must be a 2-D (scenarios, periods) array")
+    k, n = cfs.shape
+
+    positive = cfs > 0.0
+    dists = np.where(positive, cfs, 0.0)
+    invested = -np.where(cfs < 0.0, cfs, 0.0).sum(axis=1)
+    cumulative_distributions = dists.sum(axis=1)
+    valid = np.isfinite(cfs).all(axis=1) & (invested > 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dpi = cumulative_distributions / invested
+        rvpi = current_nav / invested
+        tvpi = dpi + rvpi
+        moic = (cumulative_distributions + current_nav) / invested
+
+        # Mean cash-on-cash over the distribution years (0.0 if there are none)
+        n_dists = positive.sum(axis=1)
+        average_coc = np.where(
+            n_dists > 0, cumulative_distributions / n_dists / invested, 0.0
+        )
+
+        # NPV by Horner's rule, one period at a time across all rows
+        rate = float(discount_rate) if discount_rate is not None else DEFAULT_DISCOUNT_RATE
+        x = 1.0 / (1.0 + max(rate, -0.999999))
+        equity_npv = np.zeros(k)
+        for j in range(n - 1, -1, -1):
+            equity_npv *= x
+            equity_npv += cfs[:, j]
+
+        # Payback over the distribution years, as calculate_payback_period
+        # sees them: first distribution taking the running total to the
+        # invested amount, interpolated within that year.
+        cumulative = np.cumsum(dists, axis=1)
+        hit = positive & (cumulative >= invested[:, None])
+        has_hit = hit.any(axis=1)
+        first = hit.argmax(axis=1)
+        rows = np.arange(k)
+        hit_dist = dists[rows, first]
+        year_index = np.cumsum(positive, axis=1)[rows, first] - 1
+        prev_cumulative = cumulative[rows, first] - hit_dist
+        payback = np.where(
+            has_hit, year_index + (invested - prev_cumulative) / hit_dist, np.nan
+        )
+
+    equity_irr = _irr_batch(cfs)
+
+    def masked(values: np.ndarray) -> np.ndarray:
+        return np.where(valid, values, np.nan)
+
+    return EquityPerformanceBatch(
+        equity_irr=masked(equity_irr),
+        equity_npv=masked(equity_npv),
+        moic=masked(moic),
+        dpi=masked(dpi),
+        rvpi=masked(rvpi),
+        tvpi=masked(tvpi),
+        average_coc=masked(average_coc),
+        payback_period_years=masked(payback),
+    )
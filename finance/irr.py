@@ -9,13 +9,17 @@ Standards: CFA Institute, IFC Project Finance Guidelines
 
 from __future__ import annotations
 
+import math
 from datetime import datetime
 from typing import Optional, Sequence, List
 
-import numpy_financial as npf
+import numpy as np
 
-from finance.utils import as_float  # noqa: F401
-from constants import DEFAULT_DISCOUNT_RATE  # noqa: F401
+# Optional JIT for the bisection solvers; the pure-Python paths are used without it.
+try:  # pragma: no cover - env dependent
+    import numba  # type: ignore
+except Exception:  # pragma: no cover
+    numba = None  # type: ignore
 
 
 # ============================================================================
@@ -23,15 +27,34 @@ from constants import DEFAULT_DISCOUNT_RATE  # noqa: F401
 # ============================================================================
 
 
+def _brent_root(f, lo: float, hi: float, args: tuple) -> Optional[float]:
+    """
+    Root of f(r, *args) in a sign-changing bracket [lo, hi] via Brent's method.
+
+    Typically converges in ~10 evaluations against 30+ for bisection.
+    Returns None if Brent does not converge, so callers can fall back.
+    """
+    # Imported lazily: scipy.optimize adds ~0.4s to import time and the
+    # periodic IRR only gets here when Newton's method fails.
+    from scipy.optimize import brentq
+
+    try:
+        return float(brentq(f, lo, hi, args=args, xtol=1e-12, maxiter=100))
+    except (RuntimeError, ValueError):
+        return None
+
+
 def npv(rate: float, cashflows: Sequence[float]) -> float:
     """Classic periodic Net Present Value."""
     r = float(rate)
     if r <= -1.0:
         r = -0.999999
 
+    # Horner's rule in the discount factor: no pow() per period.
+    x = 1.0 / (1.0 + r)
     total = 0.0
-    for t, cf in enumerate(cashflows):
-        total += float(cf) / ((1.0 + r) ** t)
+    for cf in reversed(cashflows):
+        total = total * x + float(cf)
     return total
 
 
@@ -39,18 +62,83 @@ def irr(cashflows: Sequence[float]) -> Optional[float]:
     """Periodic Internal Rate of Return."""
     cfs: List[float] = [float(x) for x in cashflows]
 
-    try:
-        val = float(npf.irr(cfs))
-    except Exception:
-        return _irr_local(cfs)
-
-    if val != val:  # NaN check
+    # No sign change (including all-zero and empty series): no IRR.
+    inflow = sum(cf for cf in cfs if cf > 0.0)
+    outflow = -sum(cf for cf in cfs if cf < 0.0)
+    if inflow <= 0.0 or outflow <= 0.0:
         return None
+
+    # Seed from the money multiple spread evenly over the horizon.
+    guess = (inflow / outflow) ** (1.0 / max(len(cfs) - 1, 1)) - 1.0
+    val = _irr_newton(cfs, guess)
+    if val is None:
+        val = _irr_local(cfs)
+    if val is None:
+        val = _irr_roots(cfs)
     return val
 
 
+def _irr_newton(
+    cashflows: Sequence[float],
+    guess: float,
+    tol: float = 1e-12,
+    maxiter: int = 50,
+) -> Optional[float]:
+    """
+    Newton's method for IRR. Internal use only.
+
+    NPV and its derivative share one Horner pass in x = 1 / (1 + r).
+    Returns None if an iterate leaves (-1, inf), goes non-finite or the
+    method does not converge, so the caller can fall back to bisection.
+    """
+    r = guess
+    for _ in range(maxiter):
+        if not r > -1.0:
+            return None
+        x = 1.0 / (1.0 + r)
+        p = 0.0
+        dp = 0.0
+        for cf in reversed(cashflows):
+            dp = dp * x + p
+            p = p * x + cf
+        # dNPV/dr = dP/dx * dx/dr, with dx/dr = -x**2
+        slope = -dp * x * x
+        if slope == 0.0 or not math.isfinite(slope):
+            return None
+        step = p / slope
+        r -= step
+        if not math.isfinite(r):
+            return None
+        if abs(step) <= tol * (1.0 + abs(r)):
+            return r if r > -1.0 else None
+    return None
+
+
+def _irr_roots(cashflows: Sequence[float]) -> Optional[float]:
+    """
+    Polynomial-root solver for IRR. Internal use only.
+
+    Last resort for roots the bracketed solvers miss: touching roots with no
+    sign change (e.g. [1, -2, 1] at r = 0) and rates below -0.9999. Solves
+    NPV as a polynomial in x = 1 / (1 + r) and, like numpy-financial, keeps
+    the real positive roots and returns the rate closest to zero.
+    """
+    x = np.roots(np.asarray(cashflows, dtype=np.float64)[::-1])
+    x = x.real[(np.abs(x.imag) <= 1e-12 * np.maximum(np.abs(x.real), 1.0)) & (x.real > 0.0)]
+    if x.size == 0:
+        return None
+    rates = 1.0 / x - 1.0
+    return float(rates[np.argmin(np.abs(rates))])
+
+
 def _irr_local(cashflows: Sequence[float]) -> Optional[float]:
-    """Bisection solver for IRR. Internal use only."""
+    """
+    Bracketed solver for IRR. Internal use only.
+
+    Brent's method on [-0.9999, 5.0] first, in every environment; bisection
+    (the JIT kernel when Numba is importable) only if Brent fails, so the
+    root found does not depend on whether Numba is installed.
+    """
     if not cashflows:
         return None
 
@@ -69,6 +157,15 @@ def _irr_local(cashflows: Sequence[float]) -> Optional[float]:
     if (f_lo > 0 and f_hi > 0) or (f_lo < 0 and f_hi < 0):
         return None
 
+    root = _brent_root(npv, lo, hi, (cashflows,))
+    if root is not None:
+        return root
+
+    # Bisection fallback if Brent fails to converge
+    if _irr_bisect_kernel is not None:
+        val = _irr_bisect_kernel(np.array(cashflows, dtype=np.float64))
+        return None if math.isnan(val) else val
+
     for _ in range(200):
         mid = (lo + hi) / 2.0
         f_mid = npv(mid, cashflows)
@@ -84,25 +181,128 @@ def _irr_local(cashflows: Sequence[float]) -> Optional[float]:
     return (lo + hi) / 2.0
 
 
+def irr_batch(cashflows_2d: Sequence[Sequence[float]]) -> np.ndarray:
+    """
+    Periodic IRR for every row of a (scenarios, periods) cashflow matrix.
+
+    Runs the _irr_local bisection on all rows at once: each step evaluates
+    NPV for every unconverged row in one broadcast expression. The upper
+    bracket is doubled from 5.0 for rows whose NPV has not changed sign
+    there, and rows still unsolved fall back to irr(), so a row with a
+    single IRR gets the same rate as irr() gives it. Rows with several
+    IRRs may get a different one of them than irr()'s Newton iteration
+    lands on, and an all-zero row yields 0.0 where irr() gives None.
+    Rows with no sign change, or with non-finite values, yield NaN.
+    """
+    cfs = np.atleast_2d(np.asarray(cashflows_2d, dtype=np.float64))
+    if cfs.ndim != 2:
+        raise ValueError("cashflows_2d must be a 2-D (scenarios, periods) array")
+
+    k, n = cfs.shape
+    out = np.full(k, np.nan)
+    if n == 0:
+        return out
+    # Period-major copy so each Horner step reads one contiguous row
+    cfs_t = np.ascontiguousarray(cfs.T)
+
+    def npv_rows(rates: np.ndarray, periods_by_row: np.ndarray) -> np.ndarray:
+        # Horner's rule per row, vectorised across rows: one multiply-add
+        # per period instead of a pow() per (row, period).
+        x = 1.0 / (1.0 + rates)
+        total = np.zeros(rates.shape[0])
+        with np.errstate(over="ignore", invalid="ignore"):
+            for j in range(n - 1, -1, -1):
+                total *= x
+                total += periods_by_row[j]
+        return total
+
+    finite = np.isfinite(cfs).all(axis=1)
+    zero = finite & (np.abs(cfs) < 1e-12).all(axis=1)
+    out[zero] = 0.0
+    active = finite & ~zero
+
+    lo = np.full(k, -0.9999)
+    hi = np.full(k, 5.0)
+    f_lo = npv_rows(lo, cfs_t)
+    f_hi = npv_rows(hi, cfs_t)
+
+    # Rates above 500%: double the upper bracket until NPV changes sign
+    def same_sign(rows: np.ndarray) -> np.ndarray:
+        return ((f_lo[rows] > 0) & (f_hi[rows] > 0)) | ((f_lo[rows] < 0) & (f_hi[rows] < 0))
+
+    grow = np.flatnonzero(active)
+    grow = grow[same_sign(grow)]
+    for _ in range(30):
+        if grow.size == 0:
+            break
+        hi[grow] *= 2.0
+        f_hi[grow] = npv_rows(hi[grow], cfs_t[:, grow])
+        grow = grow[same_sign(grow)]
+
+    at_lo = active & (np.abs(f_lo) < 1e-12)
+    out[at_lo] = lo[at_lo]
+    active &= ~at_lo
+    at_hi = active & (np.abs(f_hi) < 1e-12)
+    out[at_hi] = hi[at_hi]
+    active &= ~at_hi
+    active &= ~(((f_lo > 0) & (f_hi > 0)) | ((f_lo < 0) & (f_hi < 0)))
+
+    for _ in range(200):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+        mid = (lo[idx] + hi[idx]) / 2.0
+        f_mid = npv_rows(mid, cfs_t[:, idx])
+
+        # Converged on |NPV|, or the bracket can no longer shrink
+        done = (np.abs(f_mid) < 1e-10) | (mid == lo[idx]) | (mid == hi[idx])
+        out[idx[done]] = mid[done]
+        active[idx[done]] = False
+
+        f_lo_rows = f_lo[idx]
+        to_hi = ~done & (((f_lo_rows < 0) & (f_mid > 0)) | ((f_lo_rows > 0) & (f_mid < 0)))
+        to_lo = ~done & ~to_hi
+        hi[idx[to_hi]] = mid[to_hi]
+        lo[idx[to_lo]] = mid[to_lo]
+        f_lo[idx[to_lo]] = f_mid[to_lo]
+
+    out[active] = (lo[active] + hi[active]) / 2.0
+
+    # Roots outside any bracket (touching roots, rates below -0.9999)
+    retry = finite & np.isnan(out) & (cfs > 0.0).any(axis=1) & (cfs < 0.0).any(axis=1)
+    for i in np.flatnonzero(retry).tolist():
+        val = irr(cfs[i].tolist())
+        if val is not None:
+            out[i] = val
+    return out
+
+
 # ============================================================================
 # DATE-AWARE XNPV/XIRR (Irregular Cashflow Timing)
 # ============================================================================
 
 
+def _year_fractions(dates: Sequence[datetime]) -> np.ndarray:
+    """Years (actual/365.25) from the first date to each date."""
+    t0 = dates[0]
+    return np.array([(date - t0).days for date in dates], dtype=np.float64) / 365.25
+
+
+def _xnpv_years(rate: float, cashflows: np.ndarray, years: np.ndarray) -> float:
+    """XNPV over precomputed year fractions: sum(cf * (1 + rate) ** -years)."""
+    return float(cashflows @ np.exp(years * -math.log1p(rate)))
+
+
 def xnpv(rate: float, cashflows: Sequence[float], dates: Sequence[datetime]) -> float:
     """Date-adjusted Net Present Value (XNPV)."""
     if len(cashflows) != len(dates):
         raise ValueError("Cashflows and dates must have same length")
+    if len(cashflows) == 0:
+        return 0.0
 
-    t0 = dates[0]
-    total = 0.0
-
-    for cf, date in zip(cashflows, dates):
-        days = (date - t0).days
-        years = days / 365.25
-        total += float(cf) / ((1.0 + rate) ** years)
-
-    return total
+    return _xnpv_years(
+        rate, np.asarray(cashflows, dtype=np.float64), _year_fractions(dates)
+    )
 
 
 def xirr(cashflows: Sequence[float], dates: Sequence[datetime]) -> Optional[float]:
@@ -120,11 +320,22 @@ def _xirr_bisect(
     cashflows: Sequence[float],
     dates: Sequence[datetime],
 ) -> Optional[float]:
-    """Bisection solver for XIRR. Internal use only."""
+    """
+    Bracketed solver for XIRR. Internal use only.
+
+    Brent's method on [-0.9999, 2.0] first, in every environment; bisection
+    (the JIT kernel when Numba is importable) only if Brent fails.
+    """
     lo, hi = -0.9999, 2.0
 
-    npv_lo = xnpv(lo, cashflows, dates)
-    npv_hi = xnpv(hi, cashflows, dates)
+    # Convert once; each bisection step is then a single vector expression.
+    # np.array copies, so read-only inputs (pandas columns) still match the
+    # kernel's writable-array signature.
+    cfs = np.array(cashflows, dtype=np.float64)
+    years = _year_fractions(dates)
+
+    npv_lo = _xnpv_years(lo, cfs, years)
+    npv_hi = _xnpv_years(hi, cfs, years)
 
     if abs(npv_lo) < 1e-8:
         return lo
@@ -134,9 +345,18 @@ def _xirr_bisect(
     if (npv_lo > 0 and npv_hi > 0) or (npv_lo < 0 and npv_hi < 0):
         return None
 
+    root = _brent_root(_xnpv_years, lo, hi, (cfs, years))
+    if root is not None:
+        return root
+
+    # Bisection fallback if Brent fails to converge
+    if _xirr_bisect_kernel is not None:
+        val = _xirr_bisect_kernel(cfs, years)
+        return None if math.isnan(val) else val
+
     for _ in range(100):
         mid = (lo + hi) / 2.0
-        npv_mid = xnpv(mid, cashflows, dates)
+        npv_mid = _xnpv_years(mid, cfs, years)
 
         if abs(npv_mid) < 1e-8:
             return mid
@@ -149,9 +369,114 @@ def _xirr_bisect(
     return (lo + hi) / 2.0
 
 
+# ============================================================================
+# JIT KERNELS (used when Numba is importable)
+# ============================================================================
+
+
+def _irr_bisect_kernel_py(cfs: np.ndarray) -> float:
+    """
+    Scalar-loop mirror of _irr_local's bisection fallback for Numba; NaN stands in for None.
+
+    NPV is evaluated inline by Horner's rule (no calls out of the kernel).
+    """
+    n = cfs.shape[0]
+    all_zero = True
+    for i in range(n):
+        if abs(cfs[i]) >= 1e-12:
+            all_zero = False
+            break
+    if all_zero:
+        return 0.0
+
+    lo, hi = -0.9999, 5.0
+    x = 1.0 / (1.0 + lo)
+    f_lo = 0.0
+    for i in range(n - 1, -1, -1):
+        f_lo = f_lo * x + cfs[i]
+    x = 1.0 / (1.0 + hi)
+    f_hi = 0.0
+    for i in range(n - 1, -1, -1):
+        f_hi = f_hi * x + cfs[i]
+
+    if abs(f_lo) < 1e-12:
+        return lo
+    if abs(f_hi) < 1e-12:
+        return hi
+    if (f_lo > 0 and f_hi > 0) or (f_lo < 0 and f_hi < 0):
+        return math.nan
+
+    for _ in range(200):
+        mid = (lo + hi) / 2.0
+        x = 1.0 / (1.0 + mid)
+        f_mid = 0.0
+        for i in range(n - 1, -1, -1):
+            f_mid = f_mid * x + cfs[i]
+
+        if abs(f_mid) < 1e-10:
+            return mid
+
+        if (f_lo < 0 and f_mid > 0) or (f_lo > 0 and f_mid < 0):
+            hi, f_hi = mid, f_mid
+        else:
+            lo, f_lo = mid, f_mid
+
+    return (lo + hi) / 2.0
+
+
+def _xirr_bisect_kernel_py(cfs: np.ndarray, years: np.ndarray) -> float:
+    """Scalar-loop mirror of _xirr_bisect's bisection for Numba; NaN stands in for None."""
+    n = cfs.shape[0]
+    lo, hi = -0.9999, 2.0
+
+    lr = -math.log1p(lo)
+    npv_lo = 0.0
+    for i in range(n):
+        npv_lo += cfs[i] * math.exp(years[i] * lr)
+    lr = -math.log1p(hi)
+    npv_hi = 0.0
+    for i in range(n):
+        npv_hi += cfs[i] * math.exp(years[i] * lr)
+
+    if abs(npv_lo) < 1e-8:
+        return lo
+    if abs(npv_hi) < 1e-8:
+        return hi
+    if (npv_lo > 0 and npv_hi > 0) or (npv_lo < 0 and npv_hi < 0):
+        return math.nan
+
+    for _ in range(100):
+        mid = (lo + hi) / 2.0
+        lr = -math.log1p(mid)
+        npv_mid = 0.0
+        for i in range(n):
+            npv_mid += cfs[i] * math.exp(years[i] * lr)
+
+        if abs(npv_mid) < 1e-8:
+            return mid
+
+        if (npv_lo < 0 and npv_mid > 0) or (npv_lo > 0 and npv_mid < 0):
+            hi = mid
+        else:
+            lo, npv_lo = mid, npv_mid
+
+    return (lo + hi) / 2.0
+
+
+if numba is not None:  # pragma: no cover - env dependent
+    _irr_bisect_kernel = numba.njit("f8(f8[::1])", cache=True)(_irr_bisect_kernel_py)
+    _xirr_bisect_kernel = numba.njit("f8(f8[::1], f8[::1])", cache=True)(
+        _xirr_bisect_kernel_py
+    )
+else:
+    _irr_bisect_kernel = None
+    _xirr_bisect_kernel = None
+
+
 __all__ = [
     "npv",
     "irr",
+    "irr_batch",
     "xnpv",
     "xirr",
 ]
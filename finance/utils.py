@@ -1,8 +1,56 @@
 """Consolidated utility functions for the finance module."""
-from typing import Any, Dict, Iterable, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+NestedGetter = Callable[[Any, Any], Any]
+
+@lru_cache(maxsize=512)
+def nested_getter(path: Tuple[str, ...]) -> NestedGetter:
+    """Compile a key path into a getter(d, default) with the descent unrolled.
+
+    One- and two-key paths (nearly every config lookup) get dedicated
+    closures; deeper paths loop. Getters are cached per path tuple.
+    """
+    if len(path) == 1:
+        (k0,) = path
+
+        def get_1(d: Any, default: Any = None) -> Any:
+            if not isinstance(d, dict):
+                return default
+            return d.get(k0, default)
+
+        return get_1
+
+    if len(path) == 2:
+        k0, k1 = path
+
+        def get_2(d: Any, default: Any = None) -> Any:
+            if not isinstance(d, dict):
+                return default
+            parent = d.get(k0, default)
+            if parent is default or not isinstance(parent, dict):
+                return default
+            return parent.get(k1, default)
+
+        return get_2
+
+    def get_n(d: Any, default: Any = None) -> Any:
+        result = d
+        for key in path:
+            if not isinstance(result, dict):
+                return default
+            result = result.get(key, default)
+            if result is default:
+                return default
+        return result
+
+    return get_n
 
 def get_nested(d: Dict[str, Any], path: Iterable[str], default: Any = None) -> Any:
-    """Safely get nested dict value using dot-notation path."""
+    """Safely get nested dict value using dot-notation path.
+
+    For a fixed path on a hot path, bind nested_getter(path) once instead.
+    """
     result = d
     for key in path:
         if not isinstance(result, dict):
@@ -45,7 +45,8 @@ MODES:
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +79,31 @@ def _pct_to_decimal(raw: Optional[float]) -> Optional[float]:
     return raw
 
 
+def _require_nonneg_decimal(raw: Any, field_name: str) -> float:
+    """Percent-or-decimal ``raw`` as a non-negative decimal, else ValueError."""
+    value = _pct_to_decimal(_as_float_or_none(raw))
+    if value is None or value < 0:
+        raise ValueError(f"Invalid {field_name}: {raw}")
+    return value
+
+
+def _first_present(d: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """Return the value of the first key present in ``d`` (even if None)."""
+    for key in keys:
+        if key in d:
+            return d[key]
+    return None
+
+
+# CAPM inputs: (canonical name, accepted keys in priority order,
+# percent-or-decimal, label used in "Invalid ..." errors).
+_CAPM_INPUTS: Tuple[Tuple[str, Tuple[str, ...], bool, str], ...] = (
+    ("risk_free_rate", ("risk_free_rate", "risk_free"), True, "risk_free"),
+    ("market_risk_premium", ("market_risk_premium", "market_premium"), True, "market_premium"),
+    ("asset_beta", ("asset_beta", "beta"), False, "beta"),
+)
+
+
 def get_nested(d: Dict[str, Any], keys: List[str], default: Any = None) -> Any:
     """Safely navigate nested dictionaries by list of keys."""
     current: Any = d
@@ -231,6 +257,10 @@ def compute_wacc_from_config(config: Dict[str, Any]) -> Dict[str, Any]:
 
     Returns a dict compatible with contracts_v14.WaccComponents.
     If WACC block is absent, returns {} and caller should fall back.
+
+    Results are memoised on the ``wacc`` block and the resolved tax rate,
+    so sweeps that share a WACC block skip re-validation. Blocks holding
+    unhashable values are computed directly.
     """
     wacc_cfg = config.get("wacc", {})
     if not wacc_cfg:
@@ -238,6 +268,41 @@ def compute_wacc_from_config(config: Dict[str, Any]) -> Dict[str, Any]:
         logger.warning("No 'wacc' block in config; evaluator will use default rate.")
         return {}
 
+    tax_rate_raw = wacc_cfg.get("tax_rate")
+    if tax_rate_raw is None:
+        tax_cfg = config.get("tax")
+        if isinstance(tax_cfg, dict):
+            tax_rate_raw = tax_cfg.get("corporate_tax_rate_pct")
+            if tax_rate_raw is None:
+                tax_rate_raw = tax_cfg.get("corporate_tax_rate")
+
+    try:
+        key = frozenset(wacc_cfg.items())
+        hash((key, tax_rate_raw))
+    except TypeError:
+        components = _wacc_from_block(wacc_cfg, tax_rate_raw)
+    else:
+        components = _cached_wacc(key, tax_rate_raw)
+
+    if components["mode"] == "capm":
+        logger.info(
+            "WACC calculated: nominal=%.2f%%, real=%s, prudential=%.2f%%",
+            components["wacc_nominal"] * 100,
+            f"{components['wacc_real']*100:.2f}%" if components["wacc_real"] is not None else "N/A",
+            components["wacc_prudential"] * 100,
+        )
+
+    return dict(components)
+
+
+@lru_cache(maxsize=64)
+def _cached_wacc(wacc_items: frozenset, tax_rate_raw: Any) -> Dict[str, Any]:
+    """Memoised :func:`_wacc_from_block`; callers must copy the result."""
+    return _wacc_from_block(dict(wacc_items), tax_rate_raw)
+
+
+def _wacc_from_block(wacc_cfg: Dict[str, Any], tax_rate_raw: Any) -> Dict[str, Any]:
+    """Validate a non-empty ``wacc`` block and build its WACC components."""
     # Simple / discount-rate-only mode
     dr_raw = wacc_cfg.get("discount_rate")
     simple_mode = wacc_cfg.get("mode", "").lower() in {"", "simple", "fixed"}
@@ -274,39 +339,28 @@ def compute_wacc_from_config(config: Dict[str, Any]) -> Dict[str, Any]:
     if mode != "capm":
         raise ValueError(f"Unknown wacc.mode: '{mode}'. Use 'capm' or 'fixed/simple'.")
 
-    # CAPM inputs (dual naming)
-    rf_raw = wacc_cfg.get("risk_free_rate", wacc_cfg.get("risk_free"))
-    mrp_raw = wacc_cfg.get("market_risk_premium", wacc_cfg.get("market_premium"))
-    asset_beta_raw = wacc_cfg.get("asset_beta", wacc_cfg.get("beta"))
-
-    if rf_raw is None:
-        raise ValueError("wacc.risk_free or wacc.risk_free_rate required for CAPM mode")
-    if mrp_raw is None:
-        raise ValueError(
-            "wacc.market_premium or wacc.market_risk_premium required for CAPM mode"
-        )
-    if asset_beta_raw is None:
-        raise ValueError("wacc.beta or wacc.asset_beta required for CAPM mode")
-
-    risk_free_rate_opt: Optional[float] = _pct_to_decimal(_as_float_or_none(rf_raw))
-    market_risk_premium_opt: Optional[float] = _pct_to_decimal(_as_float_or_none(mrp_raw))
-    asset_beta_opt: Optional[float] = _as_float_or_none(asset_beta_raw)
-
-    if risk_free_rate_opt is None or risk_free_rate_opt < 0:
-        raise ValueError(f"Invalid risk_free: {rf_raw}")
-    if market_risk_premium_opt is None or market_risk_premium_opt < 0:
-        raise ValueError(f"Invalid market_premium: {mrp_raw}")
-    if asset_beta_opt is None or asset_beta_opt < 0:
-        raise ValueError(f"Invalid beta: {asset_beta_raw}")
-
-    # Type narrowing: after validation, assign to non-Optional
-    risk_free_rate: float = risk_free_rate_opt
-    market_risk_premium: float = market_risk_premium_opt
-    asset_beta: float = asset_beta_opt
+    # CAPM inputs (dual naming): check presence first, then validate.
+    capm_raw: Dict[str, Any] = {}
+    for name, keys, _, _ in _CAPM_INPUTS:
+        raw = _first_present(wacc_cfg, keys)
+        if raw is None:
+            raise ValueError(f"wacc.{keys[1]} or wacc.{keys[0]} required for CAPM mode")
+        capm_raw[name] = raw
+
+    capm: Dict[str, float] = {}
+    for name, _, is_pct, label in _CAPM_INPUTS:
+        raw = capm_raw[name]
+        if is_pct:
+            capm[name] = _require_nonneg_decimal(raw, label)
+            continue
+        value = _as_float_or_none(raw)
+        if value is None or value < 0:
+            raise ValueError(f"Invalid {label}: {raw}")
+        capm[name] = value
 
     # Capital structure
     d_to_e_raw = wacc_cfg.get("target_debt_to_equity")
-    gearing_raw = wacc_cfg.get("target_gearing", wacc_cfg.get("gearing"))
+    gearing_raw = _first_present(wacc_cfg, ("target_gearing", "gearing"))
 
     d_to_v: float
     d_to_e: float
@@ -329,10 +383,7 @@ def compute_wacc_from_config(config: Dict[str, Any]) -> Dict[str, Any]:
     # Cost of debt
     kd_raw = wacc_cfg.get("cost_of_debt")
     if kd_raw is not None:
-        cost_of_debt_opt: Optional[float] = _pct_to_decimal(_as_float_or_none(kd_raw))
-        if cost_of_debt_opt is None or cost_of_debt_opt < 0:
-            raise ValueError(f"Invalid cost_of_debt: {kd_raw}")
-        cost_of_debt: float = cost_of_debt_opt
+        cost_of_debt = _require_nonneg_decimal(kd_raw, "cost_of_debt")
     else:
         base_rate_raw = wacc_cfg.get("base_rate")
         margin_raw = wacc_cfg.get("margin")
@@ -340,20 +391,11 @@ def compute_wacc_from_config(config: Dict[str, Any]) -> Dict[str, Any]:
             raise ValueError(
                 "wacc: requires either cost_of_debt or (base_rate + margin) for CAPM mode"
             )
-        base_rate_opt: Optional[float] = _pct_to_decimal(_as_float_or_none(base_rate_raw))
-        margin_opt: Optional[float] = _pct_to_decimal(_as_float_or_none(margin_raw))
-        if base_rate_opt is None or base_rate_opt < 0:
-            raise ValueError(f"Invalid base_rate: {base_rate_raw}")
-        if margin_opt is None or margin_opt < 0:
-            raise ValueError(f"Invalid margin: {margin_raw}")
-        cost_of_debt = base_rate_opt + margin_opt
-
-    # Tax rate
-    tax_rate_raw = wacc_cfg.get("tax_rate")
-    if tax_rate_raw is None:
-        tax_rate_raw = get_nested(config, ["tax", "corporate_tax_rate_pct"])
-    if tax_rate_raw is None:
-        tax_rate_raw = get_nested(config, ["tax", "corporate_tax_rate"])
+        cost_of_debt = _require_nonneg_decimal(
+            base_rate_raw, "base_rate"
+        ) + _require_nonneg_decimal(margin_raw, "margin")
+
+    # Tax rate (resolved by the caller from wacc.tax_rate or tax.*)
     if tax_rate_raw is None:
         raise ValueError("wacc.tax_rate or tax.corporate_tax_rate(_pct) required")
 
@@ -371,9 +413,9 @@ def compute_wacc_from_config(config: Dict[str, Any]) -> Dict[str, Any]:
     prudential_bps = int(wacc_cfg.get("prudential_spread_bps", 100))
 
     components = build_wacc(
-        risk_free_rate=risk_free_rate,
-        asset_beta=asset_beta,
-        market_risk_premium=market_risk_premium,
+        risk_free_rate=capm["risk_free_rate"],
+        asset_beta=capm["asset_beta"],
+        market_risk_premium=capm["market_risk_premium"],
         debt_to_value=d_to_v,
         cost_of_debt=cost_of_debt,
         tax_rate=tax_rate,
@@ -382,13 +424,6 @@ def compute_wacc_from_config(config: Dict[str, Any]) -> Dict[str, Any]:
     )
 
     components["mode"] = "capm"
-    logger.info(
-        "WACC calculated: nominal=%.2f%%, real=%s, prudential=%.2f%%",
-        components["wacc_nominal"] * 100,
-        f"{components['wacc_real']*100:.2f}%" if components["wacc_real"] is not None else "N/A",
-        components["wacc_prudential"] * 100,
-    )
-
     return components
 
 
@@ -24,8 +24,67 @@ from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 import warnings
 
+# Optional JIT for the Monte Carlo DSCR reduction; NumPy broadcasting is used without it.
+try:  # pragma: no cover - env dependent
+    import numba  # type: ignore
+except Exception:  # pragma: no cover
+    numba = None  # type: ignore
+
 warnings.filterwarnings('ignore')
 
+# FX zone boundaries (LKR/USD); a rate equal to a boundary belongs to the zone above
+_FX_ZONE_THRESHOLDS = np.array([220.0, 280.0, 330.0, 365.0])
+_FX_ZONE_LABELS = np.array(
+    ["Strong LKR", "Pre-2022", "Current zone", "Weak/Crisis", "Extreme (2022-like)"],
+    dtype=object
+)
+
+
+def _paydown_dscr_kernel_py(paydown_speeds: np.ndarray,
+                            fx_paths: np.ndarray,
+                            annual_lkr_revenue: float,
+                            annual_lkr_debt: float,
+                            annual_usd_debt: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Breach count and minimum DSCR per paydown speed, in one pass.
+    
+    Scalar-loop mirror of the broadcast DSCR grid in
+    monte_carlo_paydown_optimization for Numba: running counters replace the
+    (speeds, scenarios, years) DSCR array, so memory stays flat in the
+    number of scenarios.
+    """
+    n_speeds = paydown_speeds.shape[0]
+    n_scenarios, years_ahead = fx_paths.shape
+    breaches = np.zeros(n_speeds, dtype=np.int64)
+    min_dscr = np.ones(n_speeds)
+    
+    for p in range(n_speeds):
+        count = 0
+        lowest = 1.0
+        for year in range(1, years_ahead + 1):
+            usd_debt = annual_usd_debt * (1 - paydown_speeds[p] * (year / years_ahead))
+            for s in range(n_scenarios):
+                total_debt_lkr = annual_lkr_debt + usd_debt * fx_paths[s, year - 1]
+                if total_debt_lkr == 0:
+                    continue  # NaN DSCR: no breach, no new minimum
+                dscr = annual_lkr_revenue / total_debt_lkr
+                if dscr < 1.0:
+                    count += 1
+                if dscr < lowest:
+                    lowest = dscr
+        breaches[p] = count
+        min_dscr[p] = lowest
+    
+    return breaches, min_dscr
+
+
+if numba is not None:  # pragma: no cover - env dependent
+    _paydown_dscr_kernel = numba.njit(
+        "Tuple((i8[:], f8[:]))(f8[:], f8[:, :], f8, f8, f8)", cache=True
+    )(_paydown_dscr_kernel_py)
+else:
+    _paydown_dscr_kernel = None
+
 
 class FXCorrelationModuleCorrected:
     """
@@ -43,12 +102,21 @@ class FXCorrelationModuleCorrected:
       â€¢ Monte Carlo optimization
     """
     
+    # Fixed attribute set: no per-instance __dict__, faster attribute access
+    __slots__ = (
+        'annual_lkr_revenue', 'annual_lkr_debt', 'annual_usd_debt_origination',
+        'base_fx_rate', 'usd_debt_ratio', 'lkr_debt_ratio',
+        'fx_rates', 'mean_fx', 'std_fx', 'min_fx', 'max_fx', 'autocorr_lag1',
+        'fx_column', '_rng'
+    )
+    
     def __init__(self, 
                  monthly_fx_df: pd.DataFrame,
                  annual_lkr_revenue: float,
                  annual_lkr_debt: float,
                  annual_usd_debt: float,
-                 base_fx_rate: float = 305.0):
+                 base_fx_rate: float = 305.0,
+                 seed: Optional[int] = None):
         """
         Initialize corrected FX correlation module
         
@@ -58,14 +126,8 @@ class FXCorrelationModuleCorrected:
             annual_lkr_debt: Annual LKR debt service (fixed)
             annual_usd_debt: Annual USD debt service (fixed, in USD)
             base_fx_rate: Current/baseline FX rate for initial calculation
+            seed: Seed for this instance's FX path generator (None = fresh entropy)
         """
-        self.monthly_fx = monthly_fx_df.copy()
-        
-        # Ensure datetime and sorted
-        if 'Year-Month' in self.monthly_fx.columns:
-            self.monthly_fx['Year-Month'] = pd.to_datetime(self.monthly_fx['Year-Month'])
-            self.monthly_fx = self.monthly_fx.sort_values('Year-Month')
-        
         # Financial structure (CORRECT)
         self.annual_lkr_revenue = annual_lkr_revenue
         self.annual_lkr_debt = annual_lkr_debt
@@ -78,21 +140,45 @@ class FXCorrelationModuleCorrected:
         self.lkr_debt_ratio = (annual_lkr_debt / base_fx_rate) / total_debt_usd_equiv
         
         # FX statistics
-        if 'avg_rate' in self.monthly_fx.columns:
+        if 'avg_rate' in monthly_fx_df.columns:
             fx_col = 'avg_rate'
-        elif 'Avg FX Rate' in self.monthly_fx.columns:
+        elif 'Avg FX Rate' in monthly_fx_df.columns:
             fx_col = 'Avg FX Rate'
         else:
-            fx_col = self.monthly_fx.columns[1]
+            fx_col = monthly_fx_df.columns[1]
+        
+        # Only the rate column is needed from here on: copy just that column
+        # as a float array instead of the whole DataFrame.
+        fx_vals = monthly_fx_df[fx_col].to_numpy(dtype=np.float64, copy=True)
+        
+        # Ensure chronological order; monthly series usually arrive sorted,
+        # in which case no reordering is done.
+        if 'Year-Month' in monthly_fx_df.columns:
+            months = pd.to_datetime(monthly_fx_df['Year-Month'])
+            if not months.is_monotonic_increasing:
+                fx_vals = fx_vals[np.argsort(months.to_numpy(), kind='stable')]
+        self.fx_rates = fx_vals
+        
+        # Missing months are skipped, as pandas reductions would. Drop them
+        # once and reduce the dense array; the deviations from the mean
+        # give the sample std without a second mean pass.
+        present = fx_vals[~np.isnan(fx_vals)]
+        if present.size:
+            self.mean_fx = present.mean()
+            dev = present - self.mean_fx
+            self.std_fx = np.sqrt(np.dot(dev, dev) / (present.size - 1))
+            self.min_fx = present.min()
+            self.max_fx = present.max()
+        else:
+            self.mean_fx = self.std_fx = self.min_fx = self.max_fx = np.nan
         
-        self.mean_fx = self.monthly_fx[fx_col].mean()
-        self.std_fx = self.monthly_fx[fx_col].std()
-        self.min_fx = self.monthly_fx[fx_col].min()
-        self.max_fx = self.monthly_fx[fx_col].max()
-        self.autocorr_lag1 = self.monthly_fx[fx_col].autocorr(lag=1)
+        # Lag-1 autocorrelation over month pairs where both rates are present
+        both = np.isfinite(fx_vals[:-1]) & np.isfinite(fx_vals[1:])
+        self.autocorr_lag1 = np.corrcoef(fx_vals[:-1][both], fx_vals[1:][both])[0, 1]
         
         # For scenarios
         self.fx_column = fx_col
+        self._rng = np.random.default_rng(seed)
     
     def calculate_dscr(self, 
                       annual_lkr_revenue: float,
@@ -126,6 +212,17 @@ class FXCorrelationModuleCorrected:
         dscr = annual_lkr_revenue / total_debt_lkr
         return dscr
     
+    def _dscr_array(self, usd_debt, fx_rate) -> np.ndarray:
+        """
+        calculate_dscr at this module's revenue and LKR debt, broadcast over
+        arrays of USD debt service and FX rates (NaN where there is no debt)
+        """
+        # Python-float scalars keep the arrays' dtype (float32 stays float32)
+        total_debt_lkr = float(self.annual_lkr_debt) + np.asarray(usd_debt) * np.asarray(fx_rate)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dscr = float(self.annual_lkr_revenue) / total_debt_lkr
+        return np.where(total_debt_lkr == 0, np.nan, dscr)
+    
     def fx_sensitivity_analysis(self, 
                                fx_range_pct: List[float] = None) -> Dict:
         """
@@ -143,7 +240,6 @@ class FXCorrelationModuleCorrected:
         if fx_range_pct is None:
             fx_range_pct = [-30, -20, -10, -5, 0, 5, 10, 20, 30]
         
-        results = {}
         base_dscr = self.calculate_dscr(
             self.annual_lkr_revenue,
             self.annual_lkr_debt,
@@ -151,22 +247,26 @@ class FXCorrelationModuleCorrected:
             self.base_fx_rate
         )
         
-        for pct_change in fx_range_pct:
-            fx_rate = self.base_fx_rate * (1 + pct_change / 100)
-            dscr = self.calculate_dscr(
-                self.annual_lkr_revenue,
-                self.annual_lkr_debt,
-                self.annual_usd_debt_origination,
-                fx_rate
-            )
-            
-            dscr_change_pct = ((dscr - base_dscr) / base_dscr * 100) if base_dscr != 0 else 0
-            
-            results[f"{pct_change:+d}%"] = {
+        # All FX moves at once
+        pct = np.asarray(fx_range_pct, dtype=float)
+        fx_rates = self.base_fx_rate * (1 + pct / 100)
+        dscrs = self._dscr_array(self.annual_usd_debt_origination, fx_rates)
+        if base_dscr != 0:
+            with np.errstate(invalid='ignore'):
+                dscr_change_pcts = ((dscrs - base_dscr) / base_dscr * 100).tolist()
+        else:
+            dscr_change_pcts = [0] * len(pct)
+        
+        results = {
+            f"{pct_change:+d}%": {
                 'fx_rate': fx_rate,
                 'dscr': dscr,
                 'dscr_change_pct': dscr_change_pct
             }
+            for pct_change, fx_rate, dscr, dscr_change_pct in zip(
+                fx_range_pct, fx_rates.tolist(), dscrs.tolist(), dscr_change_pcts
+            )
+        }
         
         return {
             'base_fx': self.base_fx_rate,
@@ -196,35 +296,44 @@ class FXCorrelationModuleCorrected:
                 'Full Payoff (0% USD)': 1.00  # Eliminate USD debt
             }
         
-        results = {}
+        years_arr = np.arange(1, years + 1)
+        lkr_debt_usd = self.annual_lkr_debt / self.base_fx_rate
         
-        for scenario_name, paydown_pct in paydown_scenarios.items():
-            scenario_results = []
-            
-            for year in range(1, years + 1):
-                # Linear paydown schedule
-                usd_debt_remaining = self.annual_usd_debt_origination * (1 - paydown_pct * (year / years))
-                
-                # DSCR at current FX
-                dscr = self.calculate_dscr(
-                    self.annual_lkr_revenue,
-                    self.annual_lkr_debt,
-                    usd_debt_remaining,
-                    self.base_fx_rate
-                )
-                
-                # USD debt ratio
-                total_debt_usd = (self.annual_lkr_debt / self.base_fx_rate) + usd_debt_remaining
-                usd_ratio = usd_debt_remaining / total_debt_usd if total_debt_usd > 0 else 0
-                
-                scenario_results.append({
+        # Linear paydown schedule, every scenario and year at once,
+        # shape (scenarios, years)
+        paydown_pcts = np.asarray(list(paydown_scenarios.values()), dtype=float)
+        usd_debt_remaining = self.annual_usd_debt_origination * (
+            1 - paydown_pcts[:, None] * (years_arr[None, :] / years)
+        )
+        
+        # DSCR at current FX
+        dscr = self._dscr_array(usd_debt_remaining, self.base_fx_rate)
+        
+        # USD debt ratio
+        total_debt_usd = lkr_debt_usd + usd_debt_remaining
+        with np.errstate(divide='ignore', invalid='ignore'):
+            usd_ratio = np.where(total_debt_usd > 0, usd_debt_remaining / total_debt_usd, 0.0)
+        
+        year_list = years_arr.tolist()
+        results = {
+            scenario_name: [
+                {
                     'year': year,
-                    'usd_debt': usd_debt_remaining,
-                    'usd_ratio_pct': usd_ratio * 100,
-                    'dscr': dscr
-                })
-            
-            results[scenario_name] = scenario_results
+                    'usd_debt': usd_debt,
+                    'usd_ratio_pct': ratio_pct,
+                    'dscr': year_dscr
+                }
+                for year, usd_debt, ratio_pct, year_dscr in zip(
+                    year_list, scenario_debt, scenario_ratio, scenario_dscr
+                )
+            ]
+            for scenario_name, scenario_debt, scenario_ratio, scenario_dscr in zip(
+                paydown_scenarios,
+                usd_debt_remaining.tolist(),
+                (usd_ratio * 100).tolist(),
+                dscr.tolist()
+            )
+        }
         
         return results
     
@@ -253,37 +362,40 @@ class FXCorrelationModuleCorrected:
         if fx_shocks is None:
             fx_shocks = [220, 250, 305, 350, 365, 396]
         
-        results = {}
+        # DSCR for every (scenario, FX shock) pair, shape (scenarios, shocks)
+        paydown_pcts = np.asarray(list(paydown_scenarios.values()), dtype=float)
+        usd_debts = self.annual_usd_debt_origination * (1 - paydown_pcts)
+        dscr = self._dscr_array(usd_debts[:, None], np.asarray(fx_shocks, dtype=float)[None, :])
+        viable = dscr >= 1.0
         
-        for scenario_name, paydown_pct in paydown_scenarios.items():
-            usd_debt = self.annual_usd_debt_origination * (1 - paydown_pct)
-            
-            fx_results = {}
-            for fx_rate in fx_shocks:
-                dscr = self.calculate_dscr(
-                    self.annual_lkr_revenue,
-                    self.annual_lkr_debt,
-                    usd_debt,
-                    fx_rate
-                )
-                
-                # Interpret FX rate
-                fx_description = self._interpret_fx_rate(fx_rate)
-                
-                fx_results[f"{fx_rate} ({fx_description})"] = {
+        # Interpret all FX rates in one lookup, not once per scenario
+        fx_labels = [
+            f"{fx_rate} ({zone})"
+            for fx_rate, zone in zip(fx_shocks, self._interpret_fx_rates(fx_shocks))
+        ]
+        
+        results = {}
+        for scenario_name, scenario_dscr, scenario_viable in zip(
+            paydown_scenarios, dscr.tolist(), viable.tolist()
+        ):
+            results[scenario_name] = {
+                label: {
                     'fx_rate': fx_rate,
-                    'dscr': dscr,
-                    'viable': dscr >= 1.0
+                    'dscr': shock_dscr,
+                    'viable': shock_viable
                 }
-            
-            results[scenario_name] = fx_results
+                for label, fx_rate, shock_dscr, shock_viable in zip(
+                    fx_labels, fx_shocks, scenario_dscr, scenario_viable
+                )
+            }
         
         return results
     
     def monte_carlo_paydown_optimization(self,
                                         fx_scenarios: int = 1000,
                                         years_ahead: int = 15,
-                                        target_dscr: float = 1.25) -> Dict:
+                                        target_dscr: float = 1.25,
+                                        dtype: type = np.float64) -> Dict:
         """
         Monte Carlo optimization: Find optimal USD debt paydown schedule
         
@@ -291,6 +403,10 @@ class FXCorrelationModuleCorrected:
             fx_scenarios: Number of FX paths to simulate
             years_ahead: Projection horizon
             target_dscr: Target DSCR to maintain
+            dtype: Float type of the (speeds, scenarios, years) DSCR grid;
+                   np.float32 halves its memory traffic for large runs at the
+                   cost of ~7 significant digits in min_dscr_observed
+                   (ignored by the Numba kernel, which keeps no grid)
         
         Returns:
             Optimization results with recommended paydown path
@@ -305,74 +421,99 @@ class FXCorrelationModuleCorrected:
         # Test different paydown speeds
         paydown_speeds = np.linspace(0, 1.0, 11)  # 0% to 100% over period
         
-        for paydown_speed in paydown_speeds:
-            breaches = 0
-            min_dscr = 1.0
-            
-            for _ in range(fx_scenarios):
-                # Generate FX path
-                fx_path = self._generate_fx_path(years_ahead)
-                
-                # For each year, calculate DSCR with paydown
-                for year, fx_rate in enumerate(fx_path, 1):
-                    usd_debt = self.annual_usd_debt_origination * (1 - paydown_speed * (year / years_ahead))
-                    
-                    dscr = self.calculate_dscr(
-                        self.annual_lkr_revenue,
-                        self.annual_lkr_debt,
-                        usd_debt,
-                        fx_rate
-                    )
-                    
-                    min_dscr = min(min_dscr, dscr)
-                    
-                    if dscr < 1.0:
-                        breaches += 1
-            
-            breach_probability = breaches / (fx_scenarios * years_ahead)
+        # One set of FX paths shared by every paydown speed (common random
+        # numbers), shape (fx_scenarios, years_ahead)
+        fx_paths = self._generate_fx_paths_batch(fx_scenarios, years_ahead)
+        
+        if _paydown_dscr_kernel is not None:
+            breaches_by_speed, min_dscr_by_speed = _paydown_dscr_kernel(
+                paydown_speeds,
+                np.ascontiguousarray(fx_paths, dtype=np.float64),
+                float(self.annual_lkr_revenue),
+                float(self.annual_lkr_debt),
+                float(self.annual_usd_debt_origination)
+            )
+        else:
+            # Linear paydown schedule per speed, shape (speeds, years_ahead)
+            years = np.arange(1, years_ahead + 1)
+            usd_debt = self.annual_usd_debt_origination * (
+                1 - paydown_speeds[:, None] * (years[None, :] / years_ahead)
+            )
             
-            recommendation = "âœ“ Recommended" if breach_probability < 0.05 else ""
+            # DSCR for every (speed, scenario, year) at once
+            dscr = self._dscr_array(
+                usd_debt.astype(dtype, copy=False)[:, None, :],
+                fx_paths.astype(dtype, copy=False)[None, :, :]
+            )
+            dscr = dscr.reshape(len(paydown_speeds), -1)
             
-            results['paydown_recommendations'][f"{paydown_speed*100:.0f}% USD reduction"] = {
+            # NaN (no debt service) neither breaches nor lowers the minimum
+            breaches_by_speed = (dscr < 1.0).sum(axis=1)
+            min_dscr_by_speed = np.fmin.reduce(dscr, axis=1, initial=1.0)
+        
+        # Assemble the recommendations in one pass from the per-speed arrays
+        keys = [f"{paydown_speed*100:.0f}% USD reduction" for paydown_speed in paydown_speeds]
+        breach_probabilities = (breaches_by_speed / (fx_scenarios * years_ahead)).tolist()
+        results['paydown_recommendations'] = {
+            key: {
                 'paydown_speed': paydown_speed,
                 'breach_probability': breach_probability,
                 'min_dscr_observed': min_dscr,
-                'recommendation': recommendation
+                'recommendation': "âœ“ Recommended" if breach_probability < 0.05 else ""
             }
+            for key, paydown_speed, breach_probability, min_dscr in zip(
+                keys, paydown_speeds, breach_probabilities, min_dscr_by_speed.tolist()
+            )
+        }
         
         return results
     
     def _generate_fx_path(self, months: int) -> np.ndarray:
         """Generate FX path using historical properties"""
-        path = np.zeros(months)
-        path[0] = self.base_fx_rate
+        return self._generate_fx_paths_batch(1, months)[0]
+    
+    def _generate_fx_paths_batch(self, n_paths: int, months: int) -> np.ndarray:
+        """
+        Generate n_paths FX paths at once, shape (n_paths, months)
+        
+        Same random walk as a single path, stepped across all paths together:
+        one loop over time instead of one per path and time step. Shocks are
+        drawn from the instance generator in one call, path by path, so for a
+        given seed each row equals what successive _generate_fx_path calls
+        would produce.
+        """
+        base_fx = self.base_fx_rate
+        autocorr = self.autocorr_lag1
+        
+        paths = np.zeros((n_paths, months))
+        paths[:, 0] = base_fx
+        
+        # Random walk with autocorrelation
+        drift = (self.mean_fx - base_fx) / (months * 12)  # Mean reversion
+        shocks = self._rng.normal(0, self.std_fx / 100, size=(n_paths, months - 1))
+        lower, upper = self.min_fx * 0.8, self.max_fx * 1.2
         
         for t in range(1, months):
-            # Random walk with autocorrelation
-            drift = (self.mean_fx - self.base_fx_rate) / (months * 12)  # Mean reversion
-            shock = np.random.normal(0, self.std_fx / 100)
-            correlation = self.autocorr_lag1 * (path[t-1] - self.base_fx_rate) / self.base_fx_rate
+            prev = paths[:, t-1]
+            correlation = autocorr * (prev - base_fx) / base_fx
             
-            pct_change = drift + shock + correlation * 0.01
-            path[t] = path[t-1] * (1 + pct_change)
+            pct_change = drift + shocks[:, t-1] + correlation * 0.01
             
-            # Bounds
-            path[t] = np.clip(path[t], self.min_fx * 0.8, self.max_fx * 1.2)
+            # Bounds apply every step: a clipped level feeds the next step
+            paths[:, t] = np.clip(prev * (1 + pct_change), lower, upper)
         
-        return path
+        return paths
     
     def _interpret_fx_rate(self, fx_rate: float) -> str:
         """Interpret FX rate description"""
-        if fx_rate < 220:
-            return "Strong LKR"
-        elif fx_rate < 280:
-            return "Pre-2022"
-        elif fx_rate < 330:
-            return "Current zone"
-        elif fx_rate < 365:
-            return "Weak/Crisis"
-        else:
-            return "Extreme (2022-like)"
+        return self._interpret_fx_rates([fx_rate])[0]
+    
+    def _interpret_fx_rates(self, fx_rates) -> np.ndarray:
+        """Interpret an array of FX rates in one lookup (NaN reads as Extreme)"""
+        zones = np.searchsorted(
+            _FX_ZONE_THRESHOLDS, np.asarray(fx_rates, dtype=float), side='right'
+        )
+        return _FX_ZONE_LABELS[zones]
     
     def generate_audit_report(self) -> Dict:
         """Generate audit report"""
@@ -14,17 +14,50 @@ Usage: python3 fx_data_processor.py <csv_file>
 Output: 10 YAML files (5 recent periods + 5 historical decades)
 """
 
+import os
 import pandas as pd
 import numpy as np
 import yaml
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 
-def process_fx_csv_dual_regime(csv_file):
+# Prefer the libyaml-backed emitter; fall back to the pure-Python one.
+try:
+    from yaml import CSafeDumper as _YDumper
+except ImportError:
+    from yaml import SafeDumper as _YDumper
+
+# Optional JIT for the monthly metrics; NumPy windowing is used without it.
+try:  # pragma: no cover - env dependent
+    import numba  # type: ignore
+except Exception:  # pragma: no cover
+    numba = None  # type: ignore
+
+# pyarrow is optional; when present pandas can hand CSV parsing to its
+# multithreaded reader.
+try:  # pragma: no cover - env dependent
+    import pyarrow  # type: ignore  # noqa: F401
+    _CSV_ENGINE = 'pyarrow'
+except Exception:  # pragma: no cover
+    _CSV_ENGINE = None
+
+def _read_fx_csv(csv_file):
+    """Read the raw FX CSV, with the pyarrow engine when it is installed"""
+    if _CSV_ENGINE is not None:
+        try:
+            return pd.read_csv(csv_file, engine=_CSV_ENGINE)
+        except Exception:
+            pass  # fall back to the default C parser
+    return pd.read_csv(csv_file)
+
+def process_fx_csv_dual_regime(csv_file, workers=None):
     """
     Load complete FX CSV and generate DUAL regime models:
     1. Recent Regime: 2016-2025 (5 periods, high granularity)
     2. Full Historical: 1975-2025 (5 decades, tail-risk)
+    
+    workers: processes per regime (default: CPU count; 1 = serial)
     """
     
     print("\n" + "="*90)
@@ -34,7 +67,7 @@ def process_fx_csv_dual_regime(csv_file):
     
     # Read complete CSV
     try:
-        df = pd.read_csv(csv_file)
+        df = _read_fx_csv(csv_file)
         
         # Handle both CSV formats
         if 'Date' in df.columns and 'Exchange Rate' in df.columns:
@@ -48,7 +81,7 @@ def process_fx_csv_dual_regime(csv_file):
             return False
         
         df['Date'] = pd.to_datetime(df['Date'])
-        df = df.sort_values('Date')
+        df = df.sort_values('Date', kind='stable', ignore_index=True)
         
         print(f"\nâœ“ CSV loaded: {len(df)} daily observations")
         print(f"  Date range: {df['Date'].min().date()} to {df['Date'].max().date()}")
@@ -106,7 +139,7 @@ def process_fx_csv_dual_regime(csv_file):
     ]
     
     # Process recent periods
-    recent_files = _process_periods(df, recent_periods, 'recent', 'LENDER-FOCUSED')
+    recent_files = _process_periods(df, recent_periods, 'recent', 'LENDER-FOCUSED', workers)
     
     # ==================================================================================
     # REGIME 2: FULL HISTORICAL (1975-2025) - 5 True Decades for Tail-Risk
@@ -160,7 +193,7 @@ def process_fx_csv_dual_regime(csv_file):
     ]
     
     # Process historical decades
-    historical_files = _process_periods(df, historical_decades, 'historical', 'TAIL-RISK FOCUS')
+    historical_files = _process_periods(df, historical_decades, 'historical', 'TAIL-RISK FOCUS', workers)
     
     # ==================================================================================
     # Summary
@@ -206,12 +239,15 @@ PYTHON CODE TO LOAD BOTH REGIMES:
 import yaml
 from glob import glob
 
+# libyaml C parser (bundled with standard PyYAML wheels); pure-Python fallback
+Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 # Load recent regime
 recent_files = sorted(glob('fx_data_recent_Period*.yaml'))
 recent_data = []
 for f in recent_files:
     with open(f) as file:
-        data = yaml.safe_load(file)
+        data = yaml.load(file, Loader=Loader)
     recent_data.extend(data['fx_monthly_data'])
 
 # Load historical decades
@@ -219,7 +255,7 @@ historical_files = sorted(glob('fx_data_historical_Decade*.yaml'))
 historical_data = []
 for f in historical_files:
     with open(f) as file:
-        data = yaml.safe_load(file)
+        data = yaml.load(file, Loader=Loader)
     historical_data.extend(data['fx_monthly_data'])
 
 # Combined analysis
@@ -229,91 +265,236 @@ print(f"Historical: {len(historical_data)} months")
     
     return True
 
-def _process_periods(df, periods_config, regime_type, regime_desc):
+def _monthly_stats(month_key, rates):
     """
-    Helper function to process periods/decades
+    Monthly mean/min/max/std of date-sorted daily rates, one row per month
+    
+    month_key is year*12 + (month-1) per observation; sorted dates make each
+    month a contiguous run, so every statistic is one reduceat over the runs
+    instead of a pandas groupby. Missing rates are skipped, as pandas does,
+    and std is the sample std (NaN for fewer than two observations).
     """
-    files_created = []
+    starts = np.flatnonzero(np.r_[True, month_key[1:] != month_key[:-1]])
+    keys = month_key[starts]
     
-    for idx, period_cfg in enumerate(periods_config, 1):
-        print(f"\n[{regime_desc} - Period/Decade {idx}] {period_cfg['description']}")
-        print("-" * 90)
-        
-        # Filter data
-        start_date = f"{period_cfg['start_year']}-01-01"
-        end_date = f"{period_cfg['end_year']}-12-31"
-        period_df = df[(df['Date'] >= start_date) & (df['Date'] <= end_date)].copy()
-        
-        if len(period_df) == 0:
-            print(f"  âš  No data for period {period_cfg['start_year']}-{period_cfg['end_year']}")
-            continue
-        
-        # Aggregate to monthly
-        period_df['YearMonth'] = period_df['Date'].dt.to_period('M')
-        monthly = period_df.groupby('YearMonth').agg({
-            'Rate': ['mean', 'min', 'max', 'std']
-        }).round(4)
-        
-        monthly.columns = ['avg_rate', 'min_rate', 'max_rate', 'std_rate']
-        monthly = monthly.reset_index()
-        monthly['date'] = monthly['YearMonth'].astype(str)
-        monthly = monthly.sort_values('date').reset_index(drop=True)
-        
-        # Calculate metrics
-        monthly['monthly_change_pct'] = monthly['avg_rate'].pct_change() * 100
-        monthly['monthly_change_pct'] = monthly['monthly_change_pct'].round(2)
-        monthly['rolling_12m_vol_pct'] = (monthly['std_rate'].rolling(window=12, min_periods=1).mean() 
-                                          / monthly['avg_rate'] * 100).round(2)
-        
-        # Build YAML
-        yaml_data = {
-            'metadata': {
-                'currency_pair': 'USD/LKR',
-                'base_currency': 'USD',
-                'quote_currency': 'LKR',
-                'regime': regime_type.upper(),
-                'period': f"{period_cfg['start_year']}-{period_cfg['end_year']}",
-                'description': period_cfg['description'],
-                'context': period_cfg['context'],
-                'regime_name': period_cfg['regime'],
-                'regime_note': period_cfg.get('note', ''),
-                'version': '1.0-dual-regime',
-                'date_range': f"{monthly['date'].iloc[0]} to {monthly['date'].iloc[-1]}",
-                'total_months': len(monthly),
-                'total_daily_obs': len(period_df),
-                'analysis_purpose': regime_desc
-            },
-            'fx_monthly_data': []
-        }
-        
-        # Add records
-        for _, row in monthly.iterrows():
-            yaml_data['fx_monthly_data'].append({
-                'date': row['date'],
-                'avg_rate': float(row['avg_rate']),
-                'min_rate': float(row['min_rate']),
-                'max_rate': float(row['max_rate']),
-                'std_rate': float(row['std_rate']),
-                'monthly_change_pct': float(row['monthly_change_pct']) if pd.notna(row['monthly_change_pct']) else 0.0,
-                'rolling_12m_vol_pct': float(row['rolling_12m_vol_pct']) if pd.notna(row['rolling_12m_vol_pct']) else 0.0
-            })
+    present = ~np.isnan(rates)
+    counts = np.add.reduceat(present.astype(np.int64), starts)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = np.add.reduceat(np.where(present, rates, 0.0), starts) / counts
         
-        # Save YAML
-        yaml_filename = f"fx_data_{regime_type}_{period_cfg['name']}.yaml"
-        with open(yaml_filename, 'w') as f:
-            yaml.dump(yaml_data, f, default_flow_style=False, sort_keys=False)
+        # Two-pass variance: deviations from each month's own mean
+        dev = np.where(present, rates - np.repeat(means, np.diff(np.r_[starts, len(rates)])), 0.0)
+        sq_dev = np.add.reduceat(dev * dev, starts)
+        stds = np.where(counts > 1, np.sqrt(sq_dev / (counts - 1)), np.nan)
+    
+    monthly = pd.DataFrame({
+        'avg_rate': means,
+        'min_rate': np.fmin.reduceat(rates, starts),
+        'max_rate': np.fmax.reduceat(rates, starts),
+        'std_rate': stds
+    }).round(4)
+    monthly['date'] = [f"{key // 12:04d}-{key % 12 + 1:02d}" for key in keys.tolist()]
+    return monthly
+
+def _monthly_metrics_kernel_py(avg, std):
+    """
+    Month-on-month change % and 12-month rolling volatility %, in one pass
+    
+    Scalar-loop mirror of _monthly_metrics for Numba. The rolling mean
+    skips missing stds and needs at least one in the window, like pandas'
+    rolling(12, min_periods=1).mean().
+    """
+    n = avg.shape[0]
+    change = np.empty(n)
+    vol = np.empty(n)
+    
+    for i in range(n):
+        if i == 0:
+            change[i] = np.nan
+        else:
+            change[i] = (avg[i] / avg[i - 1] - 1) * 100
         
-        files_created.append(yaml_filename)
+        total = 0.0
+        count = 0
+        for j in range(max(0, i - 11), i + 1):
+            if not np.isnan(std[j]):
+                total += std[j]
+                count += 1
+        vol[i] = (total / count) / avg[i] * 100 if count > 0 else np.nan
+    
+    return change, vol
+
+if numba is not None:  # pragma: no cover - env dependent
+    _monthly_metrics_kernel = numba.njit(
+        "Tuple((f8[:], f8[:]))(f8[:], f8[:])", cache=True, error_model='numpy'
+    )(_monthly_metrics_kernel_py)
+else:
+    _monthly_metrics_kernel = None
+
+def _monthly_metrics(avg, std):
+    """
+    Monthly change % (avg_rate pct_change x 100) and 12-month rolling
+    volatility % (rolling mean of std_rate / avg_rate x 100), unrounded
+    
+    Same values as the pandas pct_change / rolling(12, min_periods=1)
+    chain, without its per-call dispatch.
+    """
+    if _monthly_metrics_kernel is not None:
+        # Writable copies: the kernel signature takes mutable arrays, and
+        # DataFrame columns often come back as read-only views
+        return _monthly_metrics_kernel(
+            np.array(avg, dtype=np.float64),
+            np.array(std, dtype=np.float64)
+        )
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change = np.empty_like(avg)
+        change[:1] = np.nan
+        change[1:] = (avg[1:] / avg[:-1] - 1) * 100
         
-        # Print stats
-        print(f"  âœ“ {len(monthly)} months, {len(period_df)} daily obs")
-        print(f"  âœ“ FX range: {monthly['avg_rate'].min():.2f} - {monthly['avg_rate'].max():.2f}")
-        print(f"  âœ“ Mean volatility: {monthly['rolling_12m_vol_pct'].mean():.2f}%")
-        print(f"  âœ“ Regime: {period_cfg['regime']}")
-        print(f"  âœ“ Saved: {yaml_filename}")
+        # Trailing 12-month windows over the missing-as-zero stds, with the
+        # first 11 months seeing only the months available so far
+        present = ~np.isnan(std)
+        pad = np.zeros(11)
+        sums = np.lib.stride_tricks.sliding_window_view(
+            np.concatenate((pad, np.where(present, std, 0.0))), 12
+        ).sum(axis=1)
+        counts = np.lib.stride_tricks.sliding_window_view(
+            np.concatenate((pad, present.astype(float))), 12
+        ).sum(axis=1)
+        rolling_std = np.where(counts > 0, sums / counts, np.nan)
+        vol = rolling_std / avg * 100
+    
+    return change, vol
+
+def _process_periods(df, periods_config, regime_type, regime_desc, workers=None):
+    """
+    Helper function to process periods/decades
+    
+    Periods are independent, so with more than one worker they are
+    aggregated and written in parallel processes; reports are printed in
+    period order either way.
+    """
+    files_created = []
+    
+    # df is sorted by Date: each period is one contiguous slice, located by
+    # binary search instead of a boolean scan and copy of the whole frame
+    dates_np = df['Date'].to_numpy(dtype='datetime64[ns]')
+    rates_np = df['Rate'].to_numpy(dtype=float)
+    
+    # Month index (year*12 + month-1) of every observation, computed once
+    # for the whole series and sliced per period
+    month_key = dates_np.astype('datetime64[M]').astype(np.int64) + 1970 * 12
+    
+    tasks = []
+    for idx, period_cfg in enumerate(periods_config, 1):
+        start_date = np.datetime64(f"{period_cfg['start_year']}-01-01", 'ns')
+        end_date = np.datetime64(f"{period_cfg['end_year']}-12-31", 'ns')
+        lo = np.searchsorted(dates_np, start_date, side='left')
+        hi = np.searchsorted(dates_np, end_date, side='right')
+        tasks.append((idx, period_cfg, regime_type, regime_desc, month_key[lo:hi], rates_np[lo:hi]))
+    
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as ex:
+            outcomes = list(ex.map(_process_one, *zip(*tasks)))
+    else:
+        outcomes = [_process_one(*task) for task in tasks]
+    
+    for yaml_filename, log in outcomes:
+        print("\n".join(log))
+        if yaml_filename is not None:
+            files_created.append(yaml_filename)
     
     return files_created
 
+def _process_one(idx, period_cfg, regime_type, regime_desc, month_key, rates):
+    """
+    Aggregate one period's daily slice (month index and rate per
+    observation) and write its YAML file
+    
+    Returns (yaml_filename or None if the period has no data, report lines).
+    """
+    log = [
+        f"\n[{regime_desc} - Period/Decade {idx}] {period_cfg['description']}",
+        "-" * 90
+    ]
+    n_daily = len(rates)
+    
+    if n_daily == 0:
+        log.append(f"  âš  No data for period {period_cfg['start_year']}-{period_cfg['end_year']}")
+        return None, log
+    
+    # Aggregate to monthly
+    monthly = _monthly_stats(month_key, rates)
+    
+    # Calculate metrics
+    change_pct, vol_pct = _monthly_metrics(
+        monthly['avg_rate'].to_numpy(dtype=float),
+        monthly['std_rate'].to_numpy(dtype=float)
+    )
+    monthly['monthly_change_pct'] = np.round(change_pct, 2)
+    monthly['rolling_12m_vol_pct'] = np.round(vol_pct, 2)
+    
+    # Build YAML
+    yaml_data = {
+        'metadata': {
+            'currency_pair': 'USD/LKR',
+            'base_currency': 'USD',
+            'quote_currency': 'LKR',
+            'regime': regime_type.upper(),
+            'period': f"{period_cfg['start_year']}-{period_cfg['end_year']}",
+            'description': period_cfg['description'],
+            'context': period_cfg['context'],
+            'regime_name': period_cfg['regime'],
+            'regime_note': period_cfg.get('note', ''),
+            'version': '1.0-dual-regime',
+            'date_range': f"{monthly['date'].iloc[0]} to {monthly['date'].iloc[-1]}",
+            'total_months': len(monthly),
+            'total_daily_obs': n_daily,
+            'analysis_purpose': regime_desc
+        },
+        'fx_monthly_data': []
+    }
+    
+    # Add records: one zipped pass over plain column lists instead of
+    # a Series per row (missing metrics are written as 0.0)
+    metrics = monthly[['monthly_change_pct', 'rolling_12m_vol_pct']].fillna(0.0)
+    yaml_data['fx_monthly_data'] = [
+        {
+            'date': date,
+            'avg_rate': avg_rate,
+            'min_rate': min_rate,
+            'max_rate': max_rate,
+            'std_rate': std_rate,
+            'monthly_change_pct': change_pct,
+            'rolling_12m_vol_pct': vol_pct
+        }
+        for date, avg_rate, min_rate, max_rate, std_rate, change_pct, vol_pct in zip(
+            monthly['date'].tolist(),
+            monthly['avg_rate'].to_numpy(dtype=float).tolist(),
+            monthly['min_rate'].to_numpy(dtype=float).tolist(),
+            monthly['max_rate'].to_numpy(dtype=float).tolist(),
+            monthly['std_rate'].to_numpy(dtype=float).tolist(),
+            metrics['monthly_change_pct'].to_numpy(dtype=float).tolist(),
+            metrics['rolling_12m_vol_pct'].to_numpy(dtype=float).tolist()
+        )
+    ]
+    
+    # Save YAML
+    yaml_filename = f"fx_data_{regime_type}_{period_cfg['name']}.yaml"
+    with open(yaml_filename, 'w') as f:
+        yaml.dump(yaml_data, f, Dumper=_YDumper, default_flow_style=False, sort_keys=False)
+    
+    # Stats
+    log.append(f"  âœ“ {len(monthly)} months, {n_daily} daily obs")
+    log.append(f"  âœ“ FX range: {monthly['avg_rate'].min():.2f} - {monthly['avg_rate'].max():.2f}")
+    log.append(f"  âœ“ Mean volatility: {monthly['rolling_12m_vol_pct'].mean():.2f}%")
+    log.append(f"  âœ“ Regime: {period_cfg['regime']}")
+    log.append(f"  âœ“ Saved: {yaml_filename}")
+    
+    return yaml_filename, log
+
 if __name__ == '__main__':
     import sys
     
@@ -1,5 +1,11 @@
 import yaml
 
+# Prefer the libyaml-backed emitter; fall back to the pure-Python one.
+try:
+    from yaml import CSafeDumper as _YDumper
+except ImportError:
+    from yaml import SafeDumper as _YDumper
+
 def prompt_float(label, default):
     inp = input(f"{label} [{default}]: ")
     return float(inp) if inp.strip() else default
@@ -55,7 +61,7 @@ def main():
     if not fname:
         fname = "scenario_autogen.yaml"
     with open(fname, "w") as f:
-        yaml.dump(scenario, f, default_flow_style=False)
+        yaml.dump(scenario, f, Dumper=_YDumper, default_flow_style=False)
     print(f"Scenario written to {fname}")
 
 if __name__ == "__main__":
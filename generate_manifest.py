@@ -8,6 +8,13 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any
 
+# orjson is optional (perf extra); its indented output matches
+# json.dump(indent=2, ensure_ascii=False) for manifest contents.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def create_manifest_from_zip(zip_path: Path) -> Dict[str, Any]:
     """Extract file list from existing zip and create manifest."""
     
@@ -20,26 +27,27 @@ def create_manifest_from_zip(zip_path: Path) -> Dict[str, Any]:
         "files": []
     }
     
+    files = manifest["files"]
+    total_files = 0
     total_uncompressed = 0
     
+    # One pass over the entries: count, total and describe files together
     with zipfile.ZipFile(zip_path, 'r') as zf:
-        file_list = zf.infolist()
-        manifest["metadata"]["total_files"] = len([f for f in file_list if not f.is_dir()])
-        
-        for info in file_list:
+        for info in zf.infolist():
             if info.is_dir():
                 continue
-                
-            file_info = {
+            
+            total_files += 1
+            total_uncompressed += info.file_size
+            files.append({
                 "path": info.filename,
                 "size_bytes": info.file_size,
                 "compressed_size_bytes": info.compress_size,
                 "modified_at": datetime(*info.date_time).isoformat(),
                 "extension": Path(info.filename).suffix.lower(),
-            }
-            manifest["files"].append(file_info)
-            total_uncompressed += info.file_size
+            })
     
+    manifest["metadata"]["total_files"] = total_files
     manifest["metadata"]["total_uncompressed_bytes"] = total_uncompressed
     
     if total_uncompressed > 0:
@@ -62,8 +70,11 @@ def main(argv: list[str]) -> int:
     manifest = create_manifest_from_zip(zip_path)
     manifest_path = zip_path.with_suffix('.json')
     
-    with open(manifest_path, 'w', encoding='utf-8') as f:
-        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        manifest_path.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+    else:
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
     
     print(f"✓ Manifest created: {manifest_path}")
     print(f"  Files: {manifest['metadata']['total_files']}")
@@ -95,3 +95,66 @@ def test_schema_guard_detects_missing_corporate_tax_rate():
     msg = str(excinfo.value)
     # We expect the corporate_tax_rate logical name to be mentioned
     assert "corporate_tax_rate" in msg
+
+
+def _first_resolved_value(raw_config, paths):
+    """Reference generic path walk: first candidate path whose key is present."""
+    for path in paths:
+        parent = raw_config
+        for seg in path[:-1]:
+            if not isinstance(parent, dict) or seg not in parent:
+                parent = None
+                break
+            parent = parent[seg]
+        if isinstance(parent, dict) and path[-1] in parent:
+            return parent[path[-1]]
+    return None
+
+
+def test_compiled_lookup_matches_generic_path_walk():
+    """
+    RequiredFieldSpec.resolve() must agree with a generic path walk,
+    including a present-but-None key stopping the search.
+    """
+    from analytics.config_schema import RequiredFieldSpec, get_field_lookup
+
+    spec = RequiredFieldSpec(
+        module="unit_test",
+        name="x",
+        paths=(("a", "b", "c"), ("a", "x"), ("x",)),
+    )
+    configs = [
+        {},
+        {"x": 1},
+        {"a": {"x": 2}, "x": 1},
+        {"a": {"x": None}, "x": 1},
+        {"a": {"b": {"c": 3}}, "x": 1},
+        {"a": {"b": 7}, "x": 1},
+        {"a": 5, "x": 1},
+    ]
+    for cfg in configs:
+        assert spec.resolve(cfg) == _first_resolved_value(cfg, spec.paths)
+
+    lookup = get_field_lookup("cashflow")
+    assert "corporate_tax_rate" in lookup
+    assert all(callable(g) for g in lookup["corporate_tax_rate"])
+
+
+def test_cashflow_schema_registration_is_idempotent():
+    """Re-running the cashflow registration must not duplicate specs."""
+    from finance import cashflow_v14
+
+    before = len(get_required_fields("cashflow"))
+    cashflow_v14._register_cashflow_schema()
+    assert len(get_required_fields("cashflow")) == before
+
+
+def test_reloading_a_registering_module_does_not_grow_registry():
+    """A reload re-runs import-time registration; specs are replaced by name."""
+    import importlib
+
+    from finance import epc_helper_v14
+
+    before = [spec.name for spec in get_required_fields("cashflow")]
+    importlib.reload(epc_helper_v14)
+    assert [spec.name for spec in get_required_fields("cashflow")] == before
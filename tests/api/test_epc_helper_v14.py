@@ -27,7 +27,7 @@ and current FX resolution logic:
     total_lcy
 """
 
-from dutchbay_v14chat.finance.v14.epc_helper import epc_breakdown_dict
+from dutchbay_v14chat.finance.v14.epc_helper import epc_breakdown_batch, epc_breakdown_dict
 
 
 EXPECTED_KEYS = {
@@ -109,3 +109,19 @@ def test_epc_breakdown_uses_default_fx_when_config_missing_fx():
 
     # With zero percentages, total should not be less than base.
     assert breakdown["total_usd"] >= breakdown["base_cost_usd"]
+
+
+def test_epc_breakdown_batch_matches_per_config_dict():
+    configs = [
+        {"capex": {"usd_total": 100_000_000.0, "freight_pct": 0.05, "contingency_pct": 0.10},
+         "fx": {"base_rate": 350.0}},
+        {"capex": {"usd_total": 80_000_000.0, "freight_pct": None}},
+    ]
+
+    batch = epc_breakdown_batch(configs, default_fx_rate=300.0)
+
+    assert set(batch) == EXPECTED_KEYS
+    for i, config in enumerate(configs):
+        single = epc_breakdown_dict(config, default_fx_rate=300.0)
+        for key, value in single.items():
+            assert batch[key][i] == value
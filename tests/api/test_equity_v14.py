@@ -0,0 +1,38 @@
+"""
+Tests for finance.equity_v14:
+
+- calculate_equity_performance_batch matches calculate_equity_performance
+  row by row, with NaN where the scalar path returns None.
+"""
+
+import math
+
+import pytest
+
+from finance.equity_v14 import (
+    calculate_equity_performance,
+    calculate_equity_performance_batch,
+)
+
+
+def test_equity_performance_batch_matches_scalar_per_row():
+    rows = [
+        [-1000.0, 300.0, 400.0, 500.0, 0.0],
+        [-600.0, -400.0, 500.0, 500.0, 500.0],
+        [-1000.0, 100.0, 100.0, 100.0, 100.0],  # never pays back
+        [100.0, 100.0, 100.0, 100.0, 100.0],  # nothing invested
+    ]
+
+    batch = calculate_equity_performance_batch(rows, discount_rate=0.08, current_nav=50.0)
+
+    fields = ("equity_irr", "equity_npv", "moic", "dpi", "rvpi", "tvpi",
+              "average_coc", "payback_period_years")
+    for i, row in enumerate(rows):
+        single = calculate_equity_performance(row, discount_rate=0.08, current_nav=50.0)
+        for name in fields:
+            got = getattr(batch, name)[i]
+            expected = None if single is None else getattr(single, name)
+            if expected is None:
+                assert math.isnan(got), (i, name)
+            else:
+                assert got == pytest.approx(expected, abs=1e-9), (i, name)
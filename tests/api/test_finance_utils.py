@@ -37,3 +37,12 @@ def test_as_int_success_and_failure():
     # Failures and None use the default
     assert as_int("bad", default=-1) == -1
     assert as_int(None, default=99) == 99
+
+
+def test_nested_getter_matches_get_nested():
+    from finance.utils import nested_getter
+
+    data = {"a": {"b": {"c": 1}, "x": None}, "s": 5}
+    for path in [("a",), ("a", "b"), ("a", "x"), ("a", "b", "c"), ("s", "t"), ("q", "r")]:
+        assert nested_getter(path)(data, "d") == get_nested(data, path, default="d")
+    assert nested_getter(("a", "b")) is nested_getter(("a", "b"))
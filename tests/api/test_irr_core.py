@@ -52,6 +52,16 @@ def test_irr_matches_expected_range_for_example():
     assert rate == pytest.approx(0.2343, abs=1e-3)
 
 
+def test_irr_finds_roots_the_bracketed_solvers_miss():
+    """
+    Touching roots (no sign change in NPV) and rates below -0.9999 are found
+    via the cashflow polynomial's roots, as numpy-financial's irr() did.
+    """
+    assert irr([1.0, -2.0, 1.0]) == pytest.approx(0.0, abs=1e-9)
+    assert irr([-36.92, -70.53, 0.0022]) == pytest.approx(-0.9999688081, abs=1e-9)
+    assert irr([100.0, 100.0]) is None
+
+
 def test_xnpv_two_cashflows_one_year_apart_current_baseline():
     """
     Baseline XNPV behaviour for a simple dated case:
@@ -100,3 +110,97 @@ def test_xirr_raises_on_mismatched_lengths():
 
     with pytest.raises(ValueError):
         xirr(cfs, dates)
+
+
+def test_bisection_kernels_match_python_solvers(monkeypatch):
+    """
+    The Numba-targeted bisection kernels (run here as plain Python) must
+    agree with the pure-Python solvers, including the no-root case.
+    """
+    from finance import irr as irr_core
+
+    # Bisection only runs when Brent fails; disable Brent to reach it.
+    monkeypatch.setattr(irr_core, "_brent_root", lambda *a, **k: None)
+    monkeypatch.setattr(irr_core, "_irr_bisect_kernel", None)
+    monkeypatch.setattr(irr_core, "_xirr_bisect_kernel", None)
+    cases = [[-1000.0, 500.0, 500.0, 500.0], [100.0, 100.0], [0.0, 0.0]]
+    dates = [datetime(2020, 1, 1), datetime(2020, 7, 1), datetime(2021, 1, 1), datetime(2021, 7, 1)]
+    expected_irr = [irr_core._irr_local(c) for c in cases]
+    expected_xirr = irr_core._xirr_bisect([-1000.0, 400.0, 400.0, 400.0], dates)
+
+    monkeypatch.setattr(irr_core, "_irr_bisect_kernel", irr_core._irr_bisect_kernel_py)
+    monkeypatch.setattr(irr_core, "_xirr_bisect_kernel", irr_core._xirr_bisect_kernel_py)
+
+    got_irr = [irr_core._irr_local(c) for c in cases]
+    assert [g is None for g in got_irr] == [e is None for e in expected_irr]
+    for got, exp in zip(got_irr, expected_irr):
+        if exp is not None:
+            assert got == pytest.approx(exp, abs=1e-9)
+    assert irr_core._xirr_bisect([-1000.0, 400.0, 400.0, 400.0], dates) == pytest.approx(
+        expected_xirr, abs=1e-9
+    )
+
+
+def test_irr_and_xirr_do_not_depend_on_numba(monkeypatch):
+    """Brent runs first either way, so the kernel's presence changes nothing."""
+    from finance import irr as irr_core
+
+    cfs = [-1000.0, 300.0, 400.0, 500.0]
+    dates = [datetime(2020, 1, 1), datetime(2020, 9, 1), datetime(2021, 3, 1), datetime(2022, 1, 1)]
+    with_kernel = (irr_core._irr_local(cfs), irr_core._xirr_bisect(cfs, dates))
+
+    monkeypatch.setattr(irr_core, "_irr_bisect_kernel", None)
+    monkeypatch.setattr(irr_core, "_xirr_bisect_kernel", None)
+    assert (irr_core._irr_local(cfs), irr_core._xirr_bisect(cfs, dates)) == with_kernel
+
+
+def test_xirr_compiled_kernel_accepts_series_and_read_only_arrays(monkeypatch):
+    """
+    With Numba installed and Brent unavailable, xirr() dispatches to the
+    compiled kernel; pandas Series and read-only arrays must solve there,
+    not fall back to None.
+    """
+    import numpy as np
+    import pandas as pd
+
+    from finance import irr as irr_core
+
+    if irr_core._xirr_bisect_kernel is None:
+        pytest.skip("numba not installed")
+
+    cfs = [-100.0, 30.0, 40.0, 50.0, 10.0]
+    dates = [datetime(2020 + i, 1, 1) for i in range(len(cfs))]
+    expected = xirr(cfs, dates)
+    assert expected is not None
+
+    monkeypatch.setattr(irr_core, "_brent_root", lambda *a, **k: None)
+    read_only = np.array(cfs)
+    read_only.setflags(write=False)
+    assert xirr(pd.Series(cfs), dates) == pytest.approx(expected, abs=1e-9)
+    assert xirr(read_only, dates) == pytest.approx(expected, abs=1e-9)
+
+
+def test_irr_batch_matches_scalar_irr_per_row():
+    """irr_batch() solves every row at once; results match irr() per row."""
+    import math
+
+    from dutchbay_v14chat.finance.irr import irr_batch
+
+    rows = [
+        [-1000.0, 500.0, 500.0, 500.0],
+        [-1000.0, 300.0, 400.0, 500.0],
+        [100.0, 100.0, 100.0, 100.0],  # no sign change
+        [-1000.0, float("nan"), 500.0, 500.0],  # non-finite
+        [-100.0, 2000.0, 0.0, 0.0],  # IRR above the initial 500% bracket
+        [1.0, -2.0, 1.0, 0.0],  # touching root, no sign change in NPV
+    ]
+
+    got = irr_batch(rows)
+
+    assert got.shape == (6,)
+    assert got[0] == pytest.approx(irr(rows[0]), abs=1e-9)
+    assert got[1] == pytest.approx(irr(rows[1]), abs=1e-9)
+    assert math.isnan(got[2])
+    assert math.isnan(got[3])
+    assert got[4] == pytest.approx(19.0, rel=1e-9)
+    assert got[5] == pytest.approx(0.0, abs=1e-9)
@@ -0,0 +1,46 @@
+"""
+Tests for finance.wacc_v14.compute_wacc_from_config:
+
+- memoised results are equal across calls and safe to mutate;
+- blocks holding unhashable values are still computed.
+"""
+
+import pytest
+
+from finance.wacc_v14 import compute_wacc_from_config
+
+
+CAPM_CONFIG = {
+    "wacc": {
+        "mode": "capm",
+        "risk_free": 5.0,
+        "market_premium": 6.0,
+        "beta": 0.8,
+        "gearing": 60.0,
+        "cost_of_debt": 8.0,
+        "inflation_rate": 2.0,
+    },
+    "tax": {"corporate_tax_rate_pct": 24.0},
+}
+
+
+def test_compute_wacc_memoised_result_is_a_fresh_copy():
+    first = compute_wacc_from_config(CAPM_CONFIG)
+    first["wacc_nominal"] = -1.0
+
+    second = compute_wacc_from_config(CAPM_CONFIG)
+    assert second["mode"] == "capm"
+    assert second["tax_rate"] == pytest.approx(0.24)
+    assert second["wacc_nominal"] > 0.0
+
+
+def test_compute_wacc_tax_rate_from_tax_block_is_part_of_the_key():
+    other = {"wacc": CAPM_CONFIG["wacc"], "tax": {"corporate_tax_rate_pct": 30.0}}
+    assert compute_wacc_from_config(other)["tax_rate"] == pytest.approx(0.30)
+    assert compute_wacc_from_config(CAPM_CONFIG)["tax_rate"] == pytest.approx(0.24)
+
+
+def test_compute_wacc_unhashable_block_falls_back_to_direct_call():
+    config = {"wacc": dict(CAPM_CONFIG["wacc"], notes=["unhashable"]),
+              "tax": CAPM_CONFIG["tax"]}
+    assert compute_wacc_from_config(config) == compute_wacc_from_config(CAPM_CONFIG)